@@ -54,6 +54,8 @@ public:
         , wire_data_size_(other.wire_data_size_)
         , packed_offsets_(other.packed_offsets_)
         , offsets_ptr_(other.offsets_ptr_)
+        , scalar_runs_(other.scalar_runs_)
+        , strg_offsets_(other.strg_offsets_)
     {}
 
     RowCodecFlat001& operator=(const RowCodecFlat001& other) {
@@ -65,6 +67,8 @@ public:
             wire_data_size_ = other.wire_data_size_;
             packed_offsets_ = other.packed_offsets_;
             offsets_ptr_ = other.offsets_ptr_;
+            scalar_runs_ = other.scalar_runs_;
+            strg_offsets_ = other.strg_offsets_;
             guard_ = std::move(newGuard);
         }
         return *this;
@@ -102,11 +106,21 @@ public:
     bool isSetup() const noexcept { return layout_ != nullptr; }
 
 private:
+    /// Scalar columns that are adjacent both in Row::data_ and in the wire
+    /// data section, merged into one memcpy.
+    struct CopyRun {
+        uint32_t row_off;   // byte offset into Row::data_
+        uint32_t wire_off;  // byte offset into the wire data section
+        uint32_t len;       // bytes to copy
+    };
+
     LayoutGuard guard_;  // Prevents layout mutation while codec is active
     const LayoutType* layout_{nullptr};
     uint32_t wire_data_size_{0};
     const std::vector<uint32_t>* packed_offsets_{nullptr};
     const uint32_t* offsets_ptr_{nullptr};
+    std::vector<CopyRun> scalar_runs_;    // Built by setup(): scalar copy plan, layout order
+    std::vector<uint32_t> strg_offsets_;  // Built by setup(): Row::strg_ index per string column, layout order
 };
 
 
@@ -44,14 +44,35 @@ inline void RowCodecFlat001<LayoutType>::setup(const LayoutType& layout)
     
     const size_t count = layout.columnCount();
     const auto& types = layout.columnTypes();
+    const auto& offsets = layout.columnOffsets();
     const auto& packed_offsets = *packed_offsets_;
-    for (size_t i = count; i-- > 0;) {
+
+    // Resolve the per-column type dispatch once: scalars become copy runs
+    // (neighbours without alignment padding in Row::data_ share one run),
+    // strings become a list of Row::strg_ slots. Bools travel in bits_.
+    scalar_runs_.clear();
+    strg_offsets_.clear();
+    for (size_t i = 0; i < count; ++i) {
         const ColumnType type = types[i];
-        if (type == ColumnType::BOOL || type == ColumnType::STRING) {
+        if (type == ColumnType::BOOL) {
+            continue;
+        }
+        if (type == ColumnType::STRING) {
+            strg_offsets_.push_back(offsets[i]);
             continue;
         }
-        wire_data_size_ = packed_offsets[i] + static_cast<uint32_t>(sizeOf(type));
-        break;
+        const uint32_t len = static_cast<uint32_t>(sizeOf(type));
+        if (!scalar_runs_.empty()) {
+            CopyRun& last = scalar_runs_.back();
+            if (last.row_off + last.len == offsets[i] && last.wire_off + last.len == packed_offsets[i]) {
+                last.len += len;
+                continue;
+            }
+        }
+        scalar_runs_.push_back({offsets[i], packed_offsets[i], len});
+    }
+    if (!scalar_runs_.empty()) {
+        wire_data_size_ = scalar_runs_.back().wire_off + scalar_runs_.back().len;
     }
     offsets_ptr_ = packed_offsets.data();
 }
@@ -69,20 +90,14 @@ inline std::span<std::byte> RowCodecFlat001<LayoutType>::serialize(
     const uint32_t bits_sz  = rowHeaderSize();
     const uint32_t data_sz  = wire_data_size_;
     const uint32_t fixed_sz = wireFixedSize();
-    const size_t   count    = layout_->columnCount();
-
-    const ColumnType* types   = layout_->columnTypes().data();
-    const uint32_t*   offsets = layout_->columnOffsets().data();
 
     // ── Pre-scan: sum string payload sizes for a single buffer.resize() ──
     // Clamp to MAX_STRING_LENGTH — the write loop below truncates to that
     // limit, and the buffer size must match the bytes actually written
     // (an unclamped size would leave uninitialized bytes in the row span).
     size_t strg_payload = 0;
-    for (size_t i = 0; i < count; ++i) {
-        if (types[i] == ColumnType::STRING) {
-            strg_payload += std::min(row.strg_[offsets[i]].size(), MAX_STRING_LENGTH);
-        }
+    for (const uint32_t off : strg_offsets_) {
+        strg_payload += std::min(row.strg_[off].size(), MAX_STRING_LENGTH);
     }
 
     // Resize buffer once for the entire row
@@ -93,30 +108,23 @@ inline std::span<std::byte> RowCodecFlat001<LayoutType>::serialize(
         std::memcpy(&buffer[off_row], row.bits_.data(), bits_sz);
     }
 
-    // ── Single-pass: serialize all sections in one column loop ─────
-    size_t wire_off = off_row + bits_sz;
-    size_t len_off  = off_row + bits_sz + data_sz;
-    size_t pay_off  = off_row + fixed_sz;
-
-    for (size_t i = 0; i < count; ++i) {
-        const ColumnType type = types[i];
-        const uint32_t   off  = offsets[i];
+    // ── Scalars: one memcpy per copy run (no per-column type dispatch) ─
+    std::byte* wire_data = buffer.data() + off_row + bits_sz;
+    for (const CopyRun& run : scalar_runs_) {
+        std::memcpy(wire_data + run.wire_off, &row.data_[run.row_off], run.len);
+    }
 
-        if (type == ColumnType::BOOL) {
-            // bools already bulk-copied via bits_
-        } else if (type == ColumnType::STRING) {
-            const std::string& str = row.strg_[off];
-            const uint16_t len = static_cast<uint16_t>(std::min(str.size(), MAX_STRING_LENGTH));
-            std::memcpy(&buffer[len_off], &len, sizeof(uint16_t));
-            len_off += sizeof(uint16_t);
-            if (len > 0) {
-                std::memcpy(&buffer[pay_off], str.data(), len);
-                pay_off += len;
-            }
-        } else {
-            const size_t len = sizeOf(type);
-            std::memcpy(&buffer[wire_off], &row.data_[off], len);
-            wire_off += len;
+    // ── Strings: length table, then payloads, in layout order ───────
+    size_t len_off = off_row + bits_sz + data_sz;
+    size_t pay_off = off_row + fixed_sz;
+    for (const uint32_t off : strg_offsets_) {
+        const std::string& str = row.strg_[off];
+        const uint16_t len = static_cast<uint16_t>(std::min(str.size(), MAX_STRING_LENGTH));
+        std::memcpy(&buffer[len_off], &len, sizeof(uint16_t));
+        len_off += sizeof(uint16_t);
+        if (len > 0) {
+            std::memcpy(&buffer[pay_off], str.data(), len);
+            pay_off += len;
         }
     }
 
@@ -135,50 +143,40 @@ inline void RowCodecFlat001<LayoutType>::deserialize(
     const uint32_t bits_sz  = rowHeaderSize();
     const uint32_t data_sz  = wire_data_size_;
     const uint32_t fixed_sz = wireFixedSize();
-    const size_t   count    = layout_->columnCount();
 
     if (fixed_sz > buffer.size()) [[unlikely]] {
         throw std::runtime_error("RowCodecFlat001::deserialize() failed: buffer too short");
     }
 
-    const ColumnType* types   = layout_->columnTypes().data();
-    const uint32_t*   offsets = layout_->columnOffsets().data();
-
     // bits_ is sequentially packed bool values — bulk copy
     if (bits_sz > 0) {
         std::memcpy(row.bits_.data(), &buffer[0], bits_sz);
     }
 
-    size_t wire_off = bits_sz;
-    size_t len_off  = bits_sz + data_sz;
-    size_t pay_off  = fixed_sz;
-
-    for (size_t i = 0; i < count; ++i) {
-        const ColumnType type = types[i];
-        const uint32_t   off  = offsets[i];
+    // ── Scalars: one memcpy per copy run (no per-column type dispatch) ─
+    const std::byte* wire_data = buffer.data() + bits_sz;
+    for (const CopyRun& run : scalar_runs_) {
+        std::memcpy(&row.data_[run.row_off], wire_data + run.wire_off, run.len);
+    }
 
-        if (type == ColumnType::BOOL) {
-            // bools already bulk-copied via bits_
-        } else if (type == ColumnType::STRING) {
-            uint16_t len = 0;
-            std::memcpy(&len, &buffer[len_off], sizeof(uint16_t));
-            len_off += sizeof(uint16_t);
+    // ── Strings: length table, then payloads, in layout order ───────
+    size_t len_off = bits_sz + data_sz;
+    size_t pay_off = fixed_sz;
+    for (const uint32_t off : strg_offsets_) {
+        uint16_t len = 0;
+        std::memcpy(&len, &buffer[len_off], sizeof(uint16_t));
+        len_off += sizeof(uint16_t);
 
-            if (pay_off + len > buffer.size()) [[unlikely]] {
-                throw std::runtime_error("RowCodecFlat001::deserialize() string payload overflow");
-            }
+        if (pay_off + len > buffer.size()) [[unlikely]] {
+            throw std::runtime_error("RowCodecFlat001::deserialize() string payload overflow");
+        }
 
-            std::string& str = row.strg_[off];
-            if (len > 0) {
-                str.assign(reinterpret_cast<const char*>(&buffer[pay_off]), len);
-                pay_off += len;
-            } else {
-                str.clear();
-            }
+        std::string& str = row.strg_[off];
+        if (len > 0) {
+            str.assign(reinterpret_cast<const char*>(&buffer[pay_off]), len);
+            pay_off += len;
         } else {
-            const size_t len = sizeOf(type);
-            std::memcpy(&row.data_[off], &buffer[wire_off], len);
-            wire_off += len;
+            str.clear();
         }
     }
 }
@@ -113,6 +113,8 @@ namespace bcsv {
     constexpr size_t MIN_PACKET_SIZE         = 64 * 1024;                       // 64KB minimum packet size
     constexpr size_t DEFAULT_PACKET_SIZE_KB  = 8192;                            // 8MB default packet size (in KB, for Writer::open blockSizeKB param)
     constexpr size_t MAX_PACKET_SIZE         = 1024 * 1024 * 1024;              // 1GB maximum packet size
+    constexpr size_t WRITER_STREAM_BUFFER_SIZE = 1024 * 1024;                   // 1MB Writer file-stream buffer (coalesces per-row writes into few syscalls)
+    constexpr size_t READER_STREAM_BUFFER_SIZE = 256 * 1024;                    // 256KB Reader file-stream buffer (per-row reads of stream codecs become few, large syscalls)
     /**
      * @brief Feature flag bit positions (Reserved for future optional features)
      * 
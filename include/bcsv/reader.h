@@ -13,8 +13,10 @@
 #include <cstdint>
 #include <fstream>
 #include <filesystem>
+#include <memory>
 #include <string>
 #include <vector>
+#include "definitions.h"
 #include "layout.h"
 #include "row.h"
 #include "codec_row/row_codec_dispatch.h"
@@ -40,6 +42,7 @@ namespace bcsv {
 
         FileHeader              file_header_;            // file header for accessing flags and metadata
         FilePath                file_path_;              // points to the input file
+        std::unique_ptr<char[]> stream_buf_;             // Buffer handed to stream_ (READER_STREAM_BUFFER_SIZE); declared first so it outlives stream_
         std::ifstream           stream_;                // input file binary stream
 
         // File-level codec (framing, decompression, checksums, packet lifecycle)
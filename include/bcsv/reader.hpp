@@ -42,6 +42,7 @@ namespace bcsv {
     : err_msg_()
     , file_header_()
     , file_path_()
+    , stream_buf_()
     , stream_()
     , file_codec_()
     , row_pos_(0)
@@ -115,7 +116,12 @@ namespace bcsv {
                 throw std::runtime_error("Error: No read permission for file: " + absolutePath.string());
             }
 
-            // Open the binary file
+            // Open the binary file. The stream buffer must be installed before
+            // open() to take effect; a large one turns the small per-row
+            // read() calls of the stream codecs into few, large syscalls.
+            if (!stream_buf_)
+                stream_buf_.reset(new char[READER_STREAM_BUFFER_SIZE]);
+            stream_.rdbuf()->pubsetbuf(stream_buf_.get(), READER_STREAM_BUFFER_SIZE);
             stream_.open(absolutePath, std::ios::binary);
             if (!stream_.is_open()) {
                 throw std::runtime_error("Error: Cannot open file for reading: " + absolutePath.string());
@@ -12,6 +12,7 @@
 #include <cstdint>
 #include <fstream>
 #include <filesystem>
+#include <memory>
 #include <string>
 
 #include "definitions.h"
@@ -67,6 +68,7 @@ namespace bcsv {
         std::string             err_msg_;                    // last error message description
         FileHeader              file_header_;                // File header for accessing flags and metadata
         FilePath                file_path_;                  // Always present
+        std::unique_ptr<char[]> stream_buf_;                 // Buffer handed to stream_ (WRITER_STREAM_BUFFER_SIZE); declared first so it outlives stream_
         std::ofstream           stream_;                     // Always binary file stream
 
         // File-level codec (framing, compression, checksums, packet lifecycle)
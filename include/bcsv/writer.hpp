@@ -180,7 +180,12 @@ namespace bcsv {
                 throw std::runtime_error(err_msg_);
             }
 
-            // Open the binary file
+            // Open the binary file. The stream buffer must be installed before
+            // open() to take effect; a large one turns the per-row write()
+            // calls of the file codecs into few, large syscalls.
+            if (!stream_buf_)
+                stream_buf_.reset(new char[WRITER_STREAM_BUFFER_SIZE]);
+            stream_.rdbuf()->pubsetbuf(stream_buf_.get(), WRITER_STREAM_BUFFER_SIZE);
             stream_.open(absolutePath, std::ios::binary);
             if (!stream_.good()) {
                 err_msg_ = "Error: Cannot open file for writing: " + absolutePath.string() +
@@ -113,6 +113,19 @@ def iter_arrow_batches(reader, *, batch_size=512000, columns=None, start_row=0):
         pos += batch.num_rows
 
 
+def iter_batches(reader, *, batch_size=10000, raw_strings=False):
+    """Yield column dicts (see Reader.read_batch) from an already-open Reader.
+
+    Memory-bounded: exactly one batch is held at a time. Iteration starts at
+    the reader's current row and consumes it to the end of the file.
+    """
+    while True:
+        batch = reader.read_batch(batch_size, raw_strings)
+        if batch is None:
+            break
+        yield batch
+
+
 __all__ = [
     "__version__",
     # Bundled CLI tools
@@ -139,6 +152,7 @@ __all__ = [
     "read_to_arrow",
     "write_from_arrow",
     "iter_arrow_batches",
+    "iter_batches",
     # Parquet interop
     "parquet_to_bcsv",
     "bcsv_to_parquet",
@@ -1,6 +1,6 @@
 """Type stubs for pybcsv — re-exports from the C++ extension and Python utils."""
 
-from typing import Optional, Dict
+from typing import Dict, Iterator, Optional
 
 from ._bcsv import (
     ColumnType as ColumnType,
@@ -13,6 +13,7 @@ from ._bcsv import (
     CsvWriter as CsvWriter,
     CsvReader as CsvReader,
     FileFlags as FileFlags,
+    ValidationError as ValidationError,
     SamplerMode as SamplerMode,
     SamplerErrorPolicy as SamplerErrorPolicy,
     SamplerCompileResult as SamplerCompileResult,
@@ -79,3 +80,9 @@ def iter_arrow_batches(
     columns: Optional[list] = None,
     start_row: int = 0,
 ) -> object: ...  # yields pa.RecordBatch
+def iter_batches(
+    reader: Reader,
+    *,
+    batch_size: int = 10000,
+    raw_strings: bool = False,
+) -> Iterator[dict]: ...
@@ -74,6 +74,15 @@ class Layout:
     def add_column(self, column: ColumnDefinition) -> None: ...
     @overload
     def add_column(self, name: str, type: ColumnType) -> None: ...
+    @staticmethod
+    def from_dtype(dtype: object) -> Layout:
+        """
+        Build a layout from a structured numpy dtype, one column per field.
+
+        Accepts anything np.dtype() does, e.g. [('id', 'i4'), ('value', 'f8')].
+        Numeric and bool fields keep their width; str, bytes and object fields become STRING.
+        """
+
     def column_count(self) -> int: ...
     def column_name(self, index: int) -> str: ...
     def column_type(self, index: int) -> ColumnType: ...
@@ -115,6 +124,11 @@ BATCH_COMPRESS: FileFlags = FileFlags.BATCH_COMPRESS
 
 DELTA_ENCODING: FileFlags = FileFlags.DELTA_ENCODING
 
+class ValidationError(ValueError, RuntimeError):
+    """
+    Raised when a row value is rejected by a writer (row length, type, range or string size). Subclass of ValueError and RuntimeError.
+    """
+
 class Writer:
     def __init__(self, layout: Layout, row_codec: str = "delta") -> None: ...
     def open(
@@ -126,9 +140,27 @@ class Writer:
         flags: FileFlags = FileFlags.BATCH_COMPRESS,
     ) -> bool: ...
     def write_row(self, arg: list, /) -> None: ...
+    @overload
     def write_rows(self, arg: list, /) -> None:
         """Write multiple rows efficiently with batching"""
 
+    @overload
+    def write_rows(self, arr: object) -> None:
+        """
+        Write all rows of a one-dimensional structured numpy array, or stream
+        the rows of any other iterable (e.g. a generator of tuples).
+
+        Structured-array fields are matched to layout columns by position and
+        cast to the column type. Iterables are consumed one row at a time.
+        """
+
+    def write_columns(self, columns: dict) -> None:
+        """
+        Write a dict {column_name: array} of equal-length columns.
+
+        Numeric columns are cast to the column type; string columns may be any sequence.
+        """
+
     def close(self) -> None: ...
     def flush(self) -> None: ...
     def is_open(self) -> bool: ...
@@ -162,9 +194,18 @@ class Reader:
     def row_dict(self) -> dict:
         """Get the current row as a dict {column_name: value}"""
 
-    def read_batch(self, batch_size: int = 10000) -> object:
+    def read_batch(self, batch_size: int = 10000, raw_strings: bool = False) -> object:
         """
         Read up to batch_size rows into a dict of numpy arrays/lists. Returns None at EOF.
+
+        With raw_strings=True, string columns hold undecoded UTF-8 bytes.
+        """
+
+    def read_all_arrays(self, raw_strings: bool = False) -> dict:
+        """
+        Read all remaining rows into a dict of numpy arrays (numeric) and lists (strings).
+
+        With raw_strings=True, string columns hold undecoded UTF-8 bytes.
         """
 
     def read_row(self) -> object: ...
@@ -211,6 +252,13 @@ class CsvReader:
     def delimiter(self) -> str: ...
     def decimal_separator(self) -> str: ...
     def error_msg(self) -> str: ...
+    def read_all_arrays(self, raw_strings: bool = False) -> dict:
+        """
+        Read all remaining rows into a dict of numpy arrays (numeric) and lists (strings).
+
+        With raw_strings=True, string columns hold undecoded UTF-8 bytes.
+        """
+
     def read_row(self) -> object: ...
     def read_all(self) -> list: ...
     def __enter__(self) -> CsvReader: ...
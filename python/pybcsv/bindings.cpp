@@ -78,6 +78,13 @@ struct ArrowArray {
 
 namespace {
 
+    // Raised for values rejected while filling a row (length, type, range,
+    // string size). Translated to pybcsv.ValidationError, which derives from
+    // both ValueError and RuntimeError so existing handlers keep working.
+    struct ValidationError : std::runtime_error {
+        using std::runtime_error::runtime_error;
+    };
+
     // ── Row → Python helpers ───────────────────────────────────────────
 
     template<typename RowType>
@@ -106,8 +113,47 @@ namespace {
 
     // ── Python → Row helpers ───────────────────────────────────────────
 
+    // Exact int/float/bool objects are unboxed directly from the CPython
+    // object. Everything else (numpy scalars, subclasses, strings, values
+    // outside T's range) takes the generic path in convert_numeric.
     template<typename T>
-    T convert_numeric(const nb::object& value, const std::string& target_type) {
+    inline bool convert_numeric_fast(nb::handle value, T& out) {
+        PyObject* obj = value.ptr();
+        if constexpr (std::is_same_v<T, bool>) {
+            if (!PyBool_Check(obj))
+                return false;
+            out = (obj == Py_True);
+            return true;
+        } else if constexpr (std::is_floating_point_v<T>) {
+            if (!PyFloat_CheckExact(obj))
+                return false;
+            out = static_cast<T>(PyFloat_AS_DOUBLE(obj));
+            return true;
+        } else {
+            if (!PyLong_CheckExact(obj))
+                return false;
+            int overflow = 0;
+            long long v = PyLong_AsLongLongAndOverflow(obj, &overflow);
+            if (overflow != 0)
+                return false;
+            if constexpr (std::is_signed_v<T>) {
+                if (v < static_cast<long long>(std::numeric_limits<T>::min()) ||
+                    v > static_cast<long long>(std::numeric_limits<T>::max()))
+                    return false;
+            } else {
+                if (v < 0 || static_cast<unsigned long long>(v) > std::numeric_limits<T>::max())
+                    return false;
+            }
+            out = static_cast<T>(v);
+            return true;
+        }
+    }
+
+    template<typename T>
+    T convert_numeric(nb::handle value, const char* target_type) {
+        T fast;
+        if (convert_numeric_fast(value, fast))
+            return fast;
         try {
             return nb::cast<T>(value);
         } catch (const nb::cast_error&) {
@@ -124,69 +170,169 @@ namespace {
                             return true;
                         if (s == "false" || s == "0")
                             return false;
-                        throw std::runtime_error("Invalid boolean string: " + s);
+                        throw ValidationError("Invalid boolean string: " + s);
                     } else if constexpr (std::is_integral_v<T>) {
                         return static_cast<T>(std::stoll(s));
                     } else {
                         return static_cast<T>(std::stod(s));
                     }
                 } catch (const std::out_of_range&) {
-                    throw std::runtime_error("Value out of range for " + target_type + ": " + s);
+                    throw ValidationError(std::string("Value out of range for ") + target_type + ": " + s);
                 } catch (const std::invalid_argument&) {
-                    throw std::runtime_error("Invalid numeric string for " + target_type + ": " + s);
+                    throw ValidationError(std::string("Invalid numeric string for ") + target_type + ": " + s);
                 }
             }
-            throw std::runtime_error("Cannot convert to " + target_type);
+            throw ValidationError(std::string("Cannot convert to ") + target_type);
+        }
+    }
+
+    // View the bytes of a string cell: bytes objects as-is (no encode), str
+    // via its cached UTF-8 buffer, anything else via str(). `keep` owns the
+    // converted object when one had to be created.
+    inline std::string_view string_cell_view(nb::handle value, nb::object& keep) {
+        if (PyBytes_Check(value.ptr()))
+            return {PyBytes_AS_STRING(value.ptr()),
+                    static_cast<size_t>(PyBytes_GET_SIZE(value.ptr()))};
+        nb::handle text = value;
+        if (!nb::isinstance<nb::str>(value)) {
+            keep = nb::str(value);
+            text = keep;
         }
+        Py_ssize_t size = 0;
+        const char* data = PyUnicode_AsUTF8AndSize(text.ptr(), &size);
+        if (!data)
+            throw nb::python_error();
+        return {data, static_cast<size_t>(size)};
+    }
+
+    template<typename RowType>
+    inline void set_string_cell(RowType& row, size_t col, nb::handle value) {
+        // Row::set copies the view into the row's existing string storage, so
+        // no temporary std::string is allocated per cell.
+        nb::object keep;
+        std::string_view text = string_cell_view(value, keep);
+        if (text.size() > bcsv::MAX_STRING_LENGTH)
+            throw ValidationError(
+                "String at column " + std::to_string(col) +
+                " exceeds maximum length (" + std::to_string(text.size()) +
+                " > " + std::to_string(bcsv::MAX_STRING_LENGTH) + ")");
+        row.set(col, text);
     }
 
     template<typename RowType>
     inline void set_column_value(RowType& row, size_t col,
-                                 bcsv::ColumnType ct, const nb::object& value) {
+                                 bcsv::ColumnType ct, nb::handle value) {
         try {
             switch (ct) {
 #define X(T, E) \
     case E: row.set(col, convert_numeric<T>(value, #T)); break;
                 BCSV_FOR_EACH_NUMERIC_TYPE(X)
 #undef X
-                case bcsv::ColumnType::STRING: {
-                    std::string s = nb::isinstance<nb::str>(value)
-                                        ? nb::cast<std::string>(value)
-                                        : nb::cast<std::string>(nb::str(value));
-                    if (s.size() > bcsv::MAX_STRING_LENGTH)
-                        throw std::runtime_error(
-                            "String at column " + std::to_string(col) +
-                            " exceeds maximum length (" + std::to_string(s.size()) +
-                            " > " + std::to_string(bcsv::MAX_STRING_LENGTH) + ")");
-                    row.set(col, std::move(s));
+                case bcsv::ColumnType::STRING:
+                    set_string_cell(row, col, value);
                     break;
-                }
                 default:
                     throw std::runtime_error("Unsupported column type");
             }
         } catch (const nb::cast_error& e) {
-            throw std::runtime_error("Type conversion error for column " +
-                                     std::to_string(col) + ": " + e.what());
+            throw ValidationError("Type conversion error for column " +
+                                   std::to_string(col) + ": " + e.what());
         }
     }
 
-    // ── Cached layout metadata for hot loops ───────────────────────────
+    // ── Cached layout marshaller for hot loops ─────────────────────────
+    // Resolves one setter per column when the layout is cached, so the
+    // per-row loop is an indirect call per cell with no type dispatch.
 
     class OptimizedRowWriter {
-        std::vector<bcsv::ColumnType> col_types_;
-        size_t                        n_;
+        using CellSetter = void (*)(bcsv::Row&, size_t, nb::handle);
+
+        std::vector<CellSetter> setters_;
+
+    public:
+        explicit OptimizedRowWriter(const bcsv::Layout& layout) {
+            const size_t n = layout.columnCount();
+            setters_.reserve(n);
+            for (size_t i = 0; i < n; ++i) {
+                switch (layout.columnType(i)) {
+#define X(T, E) \
+    case E: setters_.push_back([](bcsv::Row& row, size_t col, nb::handle v) { row.set(col, convert_numeric<T>(v, #T)); }); break;
+                    BCSV_FOR_EACH_NUMERIC_TYPE(X)
+#undef X
+                    case bcsv::ColumnType::STRING:
+                        setters_.push_back(&set_string_cell<bcsv::Row>);
+                        break;
+                    default:
+                        throw std::runtime_error("Unsupported column type");
+                }
+            }
+        }
+        // `items` must hold exactly one object per column (checked by callers),
+        // e.g. PySequence_Fast_ITEMS of a list or tuple.
+        void write_row_fast(bcsv::Row& row, PyObject* const* items) const {
+            size_t i = 0;
+            try {
+                for (; i < setters_.size(); ++i)
+                    setters_[i](row, i, items[i]);
+            } catch (const nb::cast_error& e) {
+                throw ValidationError("Type conversion error for column " +
+                                       std::to_string(i) + ": " + e.what());
+            }
+        }
+    };
+
+    // Rows write_rows converts per GIL release
+    constexpr size_t WRITE_ROWS_BLOCK_ROWS = 1024;
+
+    // Writes rows given as any sequence (list, tuple, ...) in blocks. Cells
+    // are converted with the GIL held into reused Row slots; each full block
+    // is then written with the GIL released once, so packet compression, the
+    // batch codec's background wait and stream flushes do not block other
+    // threads. A release per row would cost more than most writeRow() calls.
+    template<typename WriterT>
+    class SequenceRowBlockWriter {
+        using RowT = std::decay_t<decltype(std::declval<WriterT&>().row())>;
+
+        WriterT&                  w_;
+        const OptimizedRowWriter& cached_writer_;
+        size_t                    expected_;
+        std::vector<RowT>         rows_;
+        size_t                    filled_ = 0;
 
     public:
-        explicit OptimizedRowWriter(const bcsv::Layout& layout)
-            : n_(layout.columnCount()) {
-            col_types_.reserve(n_);
-            for (size_t i = 0; i < n_; ++i)
-                col_types_.emplace_back(layout.columnType(i));
+        SequenceRowBlockWriter(WriterT& w, const OptimizedRowWriter& cached_writer, size_t expected)
+            : w_(w), cached_writer_(cached_writer), expected_(expected) {
+            rows_.reserve(WRITE_ROWS_BLOCK_ROWS);
         }
-        template<typename RowType>
-        void write_row_fast(RowType& row, const nb::list& values) const {
-            for (size_t i = 0; i < n_; ++i)
-                set_column_value(row, i, col_types_[i], values[i]);
+
+        // `index` is the row's position in the batch, used in error messages.
+        // On a conversion error the rows before it are written first.
+        void add(nb::handle row_obj, size_t index) {
+            try {
+                nb::object seq = nb::steal(PySequence_Fast(row_obj.ptr(), "each row must be a sequence"));
+                if (!seq.is_valid())
+                    throw nb::python_error();
+                const auto size = static_cast<size_t>(PySequence_Fast_GET_SIZE(seq.ptr()));
+                if (size != expected_)
+                    throw ValidationError("Row " + std::to_string(index) + " length mismatch: expected " +
+                        std::to_string(expected_) + ", got " + std::to_string(size));
+                if (filled_ == rows_.size())
+                    rows_.emplace_back(w_.layout());
+                cached_writer_.write_row_fast(rows_[filled_], PySequence_Fast_ITEMS(seq.ptr()));
+            } catch (...) {
+                flush();
+                throw;
+            }
+            if (++filled_ == WRITE_ROWS_BLOCK_ROWS)
+                flush();
+        }
+
+        // Writes the converted rows with the GIL released.
+        void flush() {
+            nb::gil_scoped_release release;
+            for (size_t k = 0; k < filled_; ++k)
+                w_.write(rows_[k]);
+            filled_ = 0;
         }
     };
 
@@ -253,6 +399,27 @@ namespace {
         }
     }
 
+    // Inverse of bcsv_type_to_numpy_dtype; str/bytes/object fields map to STRING.
+    inline bcsv::ColumnType numpy_dtype_to_bcsv_type(nb::handle dt, const std::string& column) {
+        const std::string kind = nb::cast<std::string>(dt.attr("kind"));
+        if (kind == "U" || kind == "S" || kind == "O")
+            return bcsv::ColumnType::STRING;
+        const std::string type_str = nb::cast<std::string>(dt.attr("name"));
+        if (type_str == "bool") return bcsv::ColumnType::BOOL;
+        if (type_str == "int8") return bcsv::ColumnType::INT8;
+        if (type_str == "int16") return bcsv::ColumnType::INT16;
+        if (type_str == "int32") return bcsv::ColumnType::INT32;
+        if (type_str == "int64") return bcsv::ColumnType::INT64;
+        if (type_str == "uint8") return bcsv::ColumnType::UINT8;
+        if (type_str == "uint16") return bcsv::ColumnType::UINT16;
+        if (type_str == "uint32") return bcsv::ColumnType::UINT32;
+        if (type_str == "uint64") return bcsv::ColumnType::UINT64;
+        if (type_str == "float32") return bcsv::ColumnType::FLOAT;
+        if (type_str == "float64") return bcsv::ColumnType::DOUBLE;
+        throw std::runtime_error("Unsupported numpy dtype '" + type_str +
+                                 "' for column '" + column + "'");
+    }
+
     template<typename RowType>
     inline void fill_numpy_cell(const RowType& row, size_t col,
                                 bcsv::ColumnType ct, void* buf, size_t row_idx) {
@@ -277,6 +444,75 @@ namespace {
         }
     }
 
+    // ── Columnar buffers ───────────────────────────────────────────────
+
+    // Returns a pointer to a C-contiguous copy (or view) of `arr` cast to the
+    // numpy dtype of `ct`. `owner` keeps the array alive for the caller.
+    inline const void* numpy_column_buffer(nb::handle arr, bcsv::ColumnType ct,
+                                           nb::object& owner) {
+        auto np = nb::module_::import_("numpy");
+        owner = np.attr("ascontiguousarray")(arr, "dtype"_a = bcsv_type_to_numpy_dtype(ct));
+        return reinterpret_cast<const void*>(
+            nb::cast<intptr_t>(owner.attr("ctypes").attr("data")));
+    }
+
+    // Converts a sequence of Python objects into strings (None -> "").
+    inline std::vector<std::string> string_column(const nb::list& items, size_t col) {
+        std::vector<std::string> out;
+        out.reserve(items.size());
+        for (nb::handle item : items) {
+            if (item.is_none()) {
+                out.emplace_back();
+                continue;
+            }
+            nb::object keep;
+            out.emplace_back(string_cell_view(item, keep));
+            if (out.back().size() > bcsv::MAX_STRING_LENGTH)
+                throw ValidationError(
+                    "String at column " + std::to_string(col) +
+                    " exceeds maximum length (" + std::to_string(out.back().size()) +
+                    " > " + std::to_string(bcsv::MAX_STRING_LENGTH) + ")");
+        }
+        return out;
+    }
+
+    // Extracts one column for a columnar write: numeric data into a contiguous
+    // buffer (kept alive by `owner`), strings into `strings`. Returns its length.
+    inline size_t gather_column(nb::handle data, bcsv::ColumnType ct, size_t col,
+                                nb::object& owner, const void*& buf,
+                                std::vector<std::string>& strings) {
+        if (ct == bcsv::ColumnType::STRING) {
+            strings = string_column(nb::cast<nb::list>(
+                          nb::module_::import_("builtins").attr("list")(data)), col);
+            return strings.size();
+        }
+        buf = numpy_column_buffer(data, ct, owner);
+        if (nb::cast<int>(owner.attr("ndim")) != 1)
+            throw std::runtime_error("Column " + std::to_string(col) + " must be one-dimensional");
+        return static_cast<size_t>(nb::cast<int64_t>(owner.attr("size")));
+    }
+
+    // Appends num_rows rows from column buffers to an open writer.
+    // Touches no Python objects, so callers may release the GIL around it.
+    template<typename WriterT>
+    inline void append_columnar_rows(
+        WriterT& w, size_t num_rows, size_t num_cols,
+        const std::vector<const void*>&              bufs,
+        const std::vector<std::vector<std::string>>& string_cols,
+        const std::vector<bool>&                     is_string,
+        const std::vector<bcsv::ColumnType>&         col_types) {
+        auto& row = w.row();
+        for (size_t r = 0; r < num_rows; ++r) {
+            for (size_t c = 0; c < num_cols; ++c) {
+                if (is_string[c])
+                    row.set(c, string_cols[c][r]);
+                else
+                    set_from_numpy(row, c, col_types[c], bufs[c], r);
+            }
+            w.writeRow();
+        }
+    }
+
     // ── Shared columnar write loop ────────────────────────────────────
     // Used by both write_columns and write_from_arrow.
 
@@ -296,25 +532,191 @@ namespace {
             nb::gil_scoped_release release;
             if (!w.open(filename, true, compression_level, bcsv::DEFAULT_PACKET_SIZE_KB, flags))
                 throw std::runtime_error("Failed to open file for writing: " + filename);
-            for (size_t r = 0; r < num_rows; ++r) {
-                auto& row = w.row();
+            append_columnar_rows(w, num_rows, num_cols, bufs, string_cols, is_string, col_types);
+            w.close();
+        });
+    }
+
+    // ── PyReader: sequential reader with a cached row count ───────────
+
+    struct PyReader : bcsv::Reader<bcsv::Layout> {
+        using Base = bcsv::Reader<bcsv::Layout>;
+
+        std::optional<size_t> row_count_;  // count_rows() result; reset by open()/close()
+
+        bool open(const std::filesystem::path& filepath) {
+            row_count_.reset();
+            return Base::open(filepath);
+        }
+        void close() {
+            row_count_.reset();
+            Base::close();
+        }
+    };
+
+    // Total row count of the reader's file. Read from the file footer (or
+    // rebuilt from packet headers) once per open file, then cached.
+    inline size_t count_file_rows(PyReader& reader) {
+        if (!reader.isOpen())
+            throw std::runtime_error("Reader is not open");
+        if (reader.row_count_)
+            return *reader.row_count_;
+        bcsv::ReaderDirectAccess<bcsv::Layout> da;
+        {
+            nb::gil_scoped_release release;
+            if (!da.open(reader.filePath(), true))
+                throw std::runtime_error("Failed to open file for row counting: " + reader.filePath().string());
+            reader.row_count_ = da.rowCount();
+            da.close();
+        }
+        return *reader.row_count_;
+    }
+
+    // ── Columnar read loop ─────────────────────────────────────────────
+    // Builds a list of str (or bytes, with raw) from decoded string cells.
+    // The list is allocated at its final size; pure-ASCII cells are copied
+    // into a compact 1-byte str without running the UTF-8 decoder.
+    inline nb::list string_list(const std::vector<std::string>& strs, bool raw = false) {
+        nb::list out = nb::steal<nb::list>(PyList_New(static_cast<Py_ssize_t>(strs.size())));
+        if (!out.is_valid())
+            throw nb::python_error();
+        for (size_t i = 0; i < strs.size(); ++i) {
+            const std::string& s = strs[i];
+            const auto len = static_cast<Py_ssize_t>(s.size());
+            PyObject* item;
+            if (raw) {
+                item = PyBytes_FromStringAndSize(s.data(), len);
+            } else if (std::all_of(s.begin(), s.end(),
+                                   [](char ch) { return (static_cast<unsigned char>(ch) & 0x80) == 0; })) {
+                item = PyUnicode_New(len, 127);
+                if (item)
+                    std::memcpy(PyUnicode_1BYTE_DATA(item), s.data(), s.size());
+            } else {
+                item = PyUnicode_DecodeUTF8(s.data(), len, "strict");
+            }
+            if (!item)
+                throw nb::python_error();
+            PyList_SET_ITEM(out.ptr(), static_cast<Py_ssize_t>(i), item);
+        }
+        return out;
+    }
+
+    // Reads up to max_rows rows from the current position into a dict of
+    // numpy arrays (numeric) and lists (strings). Arrays are trimmed to the
+    // number of rows actually read, which is returned in rows_read. With
+    // raw_strings, string cells are returned as bytes (no UTF-8 decode).
+
+    template<typename ReaderT>
+    nb::dict read_rows_columnar(ReaderT& r, size_t max_rows, size_t& rows_read,
+                                bool raw_strings = false) {
+        const auto& layout = r.layout();
+        const size_t num_cols = layout.columnCount();
+        if (num_cols == 0)
+            throw std::runtime_error("Reader has no columns");
+
+        // Cache column metadata
+        std::vector<bcsv::ColumnType> col_types(num_cols);
+        std::vector<std::string> col_names(num_cols);
+        std::vector<bool> is_str(num_cols, false);
+        for (size_t c = 0; c < num_cols; ++c) {
+            col_types[c] = layout.columnType(c);
+            col_names[c] = layout.columnName(c);
+            is_str[c] = (col_types[c] == bcsv::ColumnType::STRING);
+        }
+
+        // Allocate numpy arrays (numeric) and C++ string vectors (strings)
+        auto np = nb::module_::import_("numpy");
+        std::vector<nb::object> arrays(num_cols);
+        std::vector<void*> bufs(num_cols, nullptr);
+        std::vector<std::vector<std::string>> string_cols(num_cols);
+
+        for (size_t c = 0; c < num_cols; ++c) {
+            if (is_str[c]) {
+                string_cols[c].reserve(max_rows);
+            } else {
+                nb::object shape = nb::make_tuple(static_cast<int64_t>(max_rows));
+                arrays[c] = np.attr("empty")(shape,
+                    "dtype"_a = bcsv_type_to_numpy_dtype(col_types[c]));
+                bufs[c] = reinterpret_cast<void*>(
+                    nb::cast<intptr_t>(arrays[c].attr("ctypes").attr("data")));
+            }
+        }
+
+        // Read loop under GIL release
+        rows_read = 0;
+        {
+            nb::gil_scoped_release release;
+            while (rows_read < max_rows && r.readNext()) {
+                const auto& row = r.row();
                 for (size_t c = 0; c < num_cols; ++c) {
-                    if (is_string[c]) {
-                        row.set(c, string_cols[c][r]);
+                    if (is_str[c]) {
+                        string_cols[c].emplace_back(row.template get<std::string>(c));
                     } else {
-                        set_from_numpy(row, c, col_types[c], bufs[c], r);
+                        fill_numpy_cell(row, c, col_types[c], bufs[c], rows_read);
                     }
                 }
-                w.writeRow();
+                ++rows_read;
             }
-            w.close();
-        });
+        }
+
+        // Build result dict
+        nb::dict result;
+        for (size_t c = 0; c < num_cols; ++c) {
+            if (is_str[c]) {
+                result[nb::cast(col_names[c])] = string_list(string_cols[c], raw_strings);
+            } else {
+                if (rows_read < max_rows) {
+                    // Slice to actual row count
+                    auto stop = nb::int_(static_cast<int64_t>(rows_read));
+                    auto sl = nb::steal(PySlice_New(Py_None, stop.ptr(), Py_None));
+                    arrays[c] = arrays[c][sl];
+                }
+                result[nb::cast(col_names[c])] = std::move(arrays[c]);
+            }
+        }
+        return result;
+    }
+
+    // Reads every remaining row when the row count is not known up front
+    // (CSV input): fills fixed-size chunks with read_rows_columnar and joins
+    // them once at the end, so the read loop still runs without the GIL.
+
+    template<typename ReaderT>
+    nb::dict read_all_columnar(ReaderT& r, size_t chunk_rows, bool raw_strings) {
+        std::vector<nb::dict> parts;
+        size_t rows_read = 0;
+        do {
+            parts.push_back(read_rows_columnar(r, chunk_rows, rows_read, raw_strings));
+        } while (rows_read == chunk_rows);
+        if (parts.size() == 1)
+            return parts.front();
+
+        auto np = nb::module_::import_("numpy");
+        nb::dict result;
+        for (auto item : parts.front()) {
+            nb::handle key = item.first;
+            if (nb::isinstance<nb::list>(item.second)) {
+                nb::list joined;
+                for (const auto& part : parts)
+                    joined.attr("extend")(part[key]);
+                result[key] = std::move(joined);
+            } else {
+                nb::list pieces;
+                for (const auto& part : parts)
+                    pieces.append(part[key]);
+                result[key] = np.attr("concatenate")(pieces);
+            }
+        }
+        return result;
     }
 
     // ── Shared binding helpers for reader-like / writer-like classes ───
     // Attaches read_row, read_all, __enter__, __exit__, __iter__, __next__
     // to any class that has .readNext(), .row(), .layout(), .close().
 
+    // Rows read_all decodes per GIL release
+    constexpr size_t READ_ALL_BATCH_ROWS = 1024;
+
     template<typename ReaderT, typename PyClassT>
     void bind_reader_iteration(PyClassT& cls) {
         cls
@@ -331,13 +733,35 @@ namespace {
                 std::vector<bcsv::ColumnType> col_types(n);
                 for (size_t i = 0; i < n; ++i)
                     col_types[i] = layout.columnType(i);
-                while (r.readNext()) {
-                    const auto& row = r.row();
-                    nb::list    row_list;
-                    for (size_t i = 0; i < n; ++i)
-                        row_list.append(extract_column_value(row, i, col_types[i]));
-                    result.append(std::move(row_list));
-                }
+                // Decode a batch of rows with the GIL released, as
+                // read_rows_columnar does, so readers on other threads can
+                // make progress. One release per batch: a release/reacquire
+                // per row would cost more than the readNext() it wraps.
+                // Rows are copied into reused slots, then converted to
+                // Python objects with the GIL held.
+                using RowT = std::decay_t<decltype(r.row())>;
+                std::vector<RowT> batch;
+                batch.reserve(READ_ALL_BATCH_ROWS);
+                size_t filled;
+                do {
+                    filled = 0;
+                    {
+                        nb::gil_scoped_release release;
+                        while (filled < READ_ALL_BATCH_ROWS && r.readNext()) {
+                            if (filled < batch.size())
+                                batch[filled] = r.row();
+                            else
+                                batch.push_back(r.row());
+                            ++filled;
+                        }
+                    }
+                    for (size_t k = 0; k < filled; ++k) {
+                        nb::list row_list;
+                        for (size_t i = 0; i < n; ++i)
+                            row_list.append(extract_column_value(batch[k], i, col_types[i]));
+                        result.append(std::move(row_list));
+                    }
+                } while (filled == READ_ALL_BATCH_ROWS);
                 return result;
             })
             .def("__enter__", [](ReaderT& r) -> ReaderT& { return r; }, nb::rv_policy::reference)
@@ -356,8 +780,8 @@ namespace {
                 auto&       row    = w.row();
                 const auto& layout = row.layout();
                 if (values.size() != layout.columnCount())
-                    throw std::runtime_error("Row length mismatch: expected " +
-                                             std::to_string(layout.columnCount()) + ", got " + std::to_string(values.size()));
+                    throw ValidationError("Row length mismatch: expected " +
+                                           std::to_string(layout.columnCount()) + ", got " + std::to_string(values.size()));
                 for (size_t i = 0; i < values.size(); ++i)
                     set_column_value(row, i, layout.columnType(i), values[i]);
                 return w.writeRow();
@@ -368,7 +792,7 @@ namespace {
             for (size_t i = 0; i < rows.size(); ++i) {
                 nb::list vals = nb::cast<nb::list>(rows[i]);
                 if (vals.size() != expected)
-                    throw std::runtime_error("Row " + std::to_string(i) + " length mismatch: expected " +
+                    throw ValidationError("Row " + std::to_string(i) + " length mismatch: expected " +
                         std::to_string(expected) + ", got " + std::to_string(vals.size()));
                 auto& row = w.row();
                 for (size_t j = 0; j < expected; ++j)
@@ -643,6 +1067,26 @@ namespace {
 NB_MODULE(_bcsv, m) {
     m.doc() = "Python bindings for the BCSV (Binary CSV) library";
 
+    // ValidationError: rejected row values (see ValidationError above)
+    nb::object validation_error = nb::steal(PyErr_NewExceptionWithDoc(
+        "pybcsv._bcsv.ValidationError",
+        "Raised when a row value is rejected by a writer (row length, type, "
+        "range or string size). Subclass of ValueError and RuntimeError.",
+        nb::make_tuple(nb::handle(PyExc_ValueError), nb::handle(PyExc_RuntimeError)).ptr(),
+        nullptr));
+    if (!validation_error.is_valid())
+        throw nb::python_error();
+    m.attr("ValidationError") = validation_error;
+    nb::register_exception_translator(
+        [](const std::exception_ptr& p, void* payload) {
+            try {
+                std::rethrow_exception(p);
+            } catch (const ValidationError& e) {
+                PyErr_SetString(static_cast<PyObject*>(payload), e.what());
+            }
+        },
+        validation_error.ptr());
+
     // ColumnType enum
     nb::enum_<bcsv::ColumnType>(m, "ColumnType")
         .value("BOOL", bcsv::ColumnType::BOOL)
@@ -676,6 +1120,23 @@ NB_MODULE(_bcsv, m) {
         .def(nb::init<const std::vector<bcsv::ColumnDefinition>&>())
         .def("add_column", [](bcsv::Layout& layout, const bcsv::ColumnDefinition& col) { return layout.addColumn(col); }, nb::arg("column"))
         .def("add_column", [](bcsv::Layout& layout, const std::string& name, bcsv::ColumnType type) { return layout.addColumn({name, type}); }, nb::arg("name"), nb::arg("type"))
+        .def_static("from_dtype", [](nb::handle dtype) {
+                nb::object dt    = nb::module_::import_("numpy").attr("dtype")(dtype);
+                nb::object names = dt.attr("names");
+                if (names.is_none())
+                    throw nb::type_error("from_dtype expects a structured numpy dtype");
+                std::vector<bcsv::ColumnDefinition> columns;
+                columns.reserve(nb::len(names));
+                for (nb::handle name : names) {
+                    std::string col_name = nb::cast<std::string>(name);
+                    nb::object  field_dt = dt[name];
+                    bcsv::ColumnType ct  = numpy_dtype_to_bcsv_type(field_dt, col_name);
+                    columns.push_back({std::move(col_name), ct});
+                }
+                return bcsv::Layout(columns); }, nb::arg("dtype"),
+             "Build a layout from a structured numpy dtype, one column per field.\n\n"
+             "Accepts anything np.dtype() does, e.g. [('id', 'i4'), ('value', 'f8')].\n"
+             "Numeric and bool fields keep their width; str, bytes and object fields become STRING.")
         .def("column_count", [](const bcsv::Layout& l) { return l.columnCount(); })
         .def("column_name", &bcsv::Layout::columnName, nb::arg("index"))
         .def("column_type", &bcsv::Layout::columnType, nb::arg("index"))
@@ -742,12 +1203,12 @@ NB_MODULE(_bcsv, m) {
         .def("write_row", [](PyWriter& pw, const nb::list& values) {
             const auto& layout = pw.visit([](auto& w) -> const bcsv::Layout& { return w.layout(); });
             if (values.size() != layout.columnCount())
-                throw std::runtime_error("Row length mismatch: expected " +
+                throw ValidationError("Row length mismatch: expected " +
                     std::to_string(layout.columnCount()) + ", got " + std::to_string(values.size()));
             auto& cached_writer = pw.ensureCachedWriter();
             pw.visit([&](auto& w) {
                 auto& row = w.row();
-                cached_writer.write_row_fast(row, values);
+                cached_writer.write_row_fast(row, PySequence_Fast_ITEMS(values.ptr()));
                 { nb::gil_scoped_release release; w.writeRow(); }
             }); })
         .def("write_rows", [](PyWriter& pw, const nb::list& rows) {
@@ -756,16 +1217,111 @@ NB_MODULE(_bcsv, m) {
             const size_t expected = layout.columnCount();
             auto& cached_writer = pw.ensureCachedWriter();
             pw.visit([&](auto& w) {
-                for (size_t i = 0; i < rows.size(); ++i) {
-                    nb::list vals = nb::cast<nb::list>(rows[i]);
-                    if (vals.size() != expected)
-                        throw std::runtime_error("Row " + std::to_string(i) + " length mismatch: expected " +
-                            std::to_string(expected) + ", got " + std::to_string(vals.size()));
-                    auto& row = w.row();
-                    cached_writer.write_row_fast(row, vals);
-                    { nb::gil_scoped_release release; w.writeRow(); }
-                }
+                SequenceRowBlockWriter block(w, cached_writer, expected);
+                for (size_t i = 0; i < rows.size(); ++i)
+                    block.add(PyList_GET_ITEM(rows.ptr(), static_cast<Py_ssize_t>(i)), i);
+                block.flush();
             }); }, "Write multiple rows efficiently with batching")
+        .def("write_rows", [](PyWriter& pw, nb::object arr) {
+                nb::object names = nb::getattr(nb::getattr(arr, "dtype", nb::none()), "names", nb::none());
+                if (names.is_none()) {
+                    // Any other iterable (generator, tuple, ...) is streamed one
+                    // row at a time, so the rows are never materialized together.
+                    nb::object it = nb::steal(PyObject_GetIter(arr.ptr()));
+                    if (!it.is_valid()) {
+                        PyErr_Clear();
+                        throw nb::type_error("write_rows expects an iterable of rows or a structured numpy array");
+                    }
+                    const auto& layout = pw.visit([](auto& w) -> const bcsv::Layout& { return w.layout(); });
+                    const size_t expected = layout.columnCount();
+                    auto& cached_writer = pw.ensureCachedWriter();
+                    pw.visit([&](auto& w) {
+                        SequenceRowBlockWriter block(w, cached_writer, expected);
+                        size_t i = 0;
+                        while (PyObject* next = PyIter_Next(it.ptr())) {
+                            nb::object row_obj = nb::steal(next);
+                            block.add(row_obj, i++);
+                        }
+                        if (PyErr_Occurred()) {
+                            // Keep the rows the iterator produced before it raised
+                            nb::python_error err;
+                            block.flush();
+                            throw err;
+                        }
+                        block.flush();
+                    });
+                    return;
+                }
+                if (nb::cast<int>(arr.attr("ndim")) != 1)
+                    throw std::runtime_error("Structured array must be one-dimensional");
+
+                const auto& layout = pw.visit([](auto& w) -> const bcsv::Layout& { return w.layout(); });
+                const size_t num_cols = layout.columnCount();
+                nb::tuple fields = nb::cast<nb::tuple>(names);
+                if (fields.size() != num_cols)
+                    throw std::runtime_error("Structured array has " + std::to_string(fields.size()) +
+                        " fields, layout has " + std::to_string(num_cols));
+
+                const size_t num_rows = nb::len(arr);
+                if (num_rows == 0) return;
+
+                // Fields are matched to layout columns by position.
+                std::vector<bcsv::ColumnType> col_types(num_cols);
+                std::vector<bool> is_string(num_cols);
+                std::vector<const void*> bufs(num_cols, nullptr);
+                std::vector<nb::object> owned_arrays(num_cols);
+                std::vector<std::vector<std::string>> string_cols(num_cols);
+                for (size_t c = 0; c < num_cols; ++c) {
+                    col_types[c] = layout.columnType(c);
+                    is_string[c] = col_types[c] == bcsv::ColumnType::STRING;
+                    nb::object field = arr[fields[c]];
+                    if (is_string[c])
+                        string_cols[c] = string_column(nb::cast<nb::list>(field.attr("tolist")()), c);
+                    else
+                        bufs[c] = numpy_column_buffer(field, col_types[c], owned_arrays[c]);
+                }
+
+                nb::gil_scoped_release rel;
+                pw.visit([&](auto& w) {
+                    append_columnar_rows(w, num_rows, num_cols, bufs, string_cols, is_string, col_types);
+                }); }, nb::arg("arr"),
+             "Write all rows of a one-dimensional structured numpy array, or stream\n"
+             "the rows of any other iterable (e.g. a generator of tuples).\n\n"
+             "Structured-array fields are matched to layout columns by position and\n"
+             "cast to the column type. Iterables are consumed one row at a time.")
+        .def("write_columns", [](PyWriter& pw, const nb::dict& columns) {
+                const auto& layout = pw.visit([](auto& w) -> const bcsv::Layout& { return w.layout(); });
+                const size_t num_cols = layout.columnCount();
+
+                std::vector<bcsv::ColumnType> col_types(num_cols);
+                std::vector<bool> is_string(num_cols);
+                std::vector<const void*> bufs(num_cols, nullptr);
+                std::vector<nb::object> owned_arrays(num_cols);
+                std::vector<std::vector<std::string>> string_cols(num_cols);
+                size_t num_rows = 0;
+                for (size_t c = 0; c < num_cols; ++c) {
+                    const std::string& name = layout.columnName(c);
+                    nb::str key(name.c_str(), name.size());
+                    if (!columns.contains(key))
+                        throw std::runtime_error("Missing column '" + name + "'");
+                    col_types[c] = layout.columnType(c);
+                    is_string[c] = col_types[c] == bcsv::ColumnType::STRING;
+                    size_t col_len = gather_column(columns[key], col_types[c], c,
+                                                   owned_arrays[c], bufs[c], string_cols[c]);
+                    if (c == 0)
+                        num_rows = col_len;
+                    else if (col_len != num_rows)
+                        throw std::runtime_error("Column '" + name + "' has " +
+                            std::to_string(col_len) + " rows, expected " + std::to_string(num_rows));
+                }
+                if (num_rows == 0) return;
+
+                nb::gil_scoped_release rel;
+                pw.visit([&](auto& w) {
+                    append_columnar_rows(w, num_rows, num_cols, bufs, string_cols, is_string, col_types);
+                }); }, nb::arg("columns"),
+             "Write a dict {column_name: array} of equal-length columns.\n\n"
+             "Numeric columns are cast to the column type; string columns may be any sequence.")
         .def("close", [](PyWriter& pw) {
             nb::gil_scoped_release release;
             pw.visit([](auto& w) { w.close(); }); })
@@ -807,49 +1363,30 @@ NB_MODULE(_bcsv, m) {
                 int64_t num_rows = nb::cast<int64_t>(batch.attr("num_rows"));
                 if (num_rows == 0) return;
 
-                auto np = nb::module_::import_("numpy");
                 std::vector<const void*> bufs(out_cols, nullptr);
                 std::vector<nb::object> owned_arrays(out_cols);
                 std::vector<std::vector<std::string>> string_cols(out_cols);
 
                 for (size_t c = 0; c < out_cols; ++c) {
                     nb::object col = batch.attr("column")(static_cast<int64_t>(c));
-                    if (is_string[c]) {
-                        string_cols[c].reserve(num_rows);
-                        nb::list pylist = nb::cast<nb::list>(col.attr("to_pylist")());
-                        for (int64_t i = 0; i < num_rows; ++i) {
-                            nb::handle item = pylist[i];
-                            string_cols[c].emplace_back(item.is_none() ? "" : nb::cast<std::string>(item));
-                        }
-                    } else {
-                        nb::object arr = col.attr("to_numpy")("zero_copy_only"_a = false);
-                        owned_arrays[c] = np.attr("ascontiguousarray")(arr,
-                            "dtype"_a = bcsv_type_to_numpy_dtype(col_types[c]));
-                        bufs[c] = reinterpret_cast<const void*>(
-                            nb::cast<intptr_t>(owned_arrays[c].attr("ctypes").attr("data")));
-                    }
+                    if (is_string[c])
+                        string_cols[c] = string_column(nb::cast<nb::list>(col.attr("to_pylist")()), c);
+                    else
+                        bufs[c] = numpy_column_buffer(col.attr("to_numpy")("zero_copy_only"_a = false),
+                                                      col_types[c], owned_arrays[c]);
                 }
 
                 {
                     nb::gil_scoped_release rel;
-                    pw.visit([&bufs, &string_cols, &col_types, &is_string,
-                              out_cols, num_rows](auto& w) {
-                        auto& row = w.row();
-                        for (int64_t r = 0; r < num_rows; ++r) {
-                            for (size_t c = 0; c < out_cols; ++c) {
-                                if (is_string[c])
-                                    row.set(c, string_cols[c][r]);
-                                else
-                                    set_from_numpy(row, c, col_types[c], bufs[c], r);
-                            }
-                            w.writeRow();
-                        }
+                    pw.visit([&](auto& w) {
+                        append_columnar_rows(w, static_cast<size_t>(num_rows), out_cols,
+                                             bufs, string_cols, is_string, col_types);
                     });
                 } }, nb::arg("batch"), "Write a pa.RecordBatch to the currently open BCSV file.");
 
     // ── Reader binding ─────────────────────────────────────────────────
 
-    using ReaderT   = bcsv::Reader<bcsv::Layout>;
+    using ReaderT   = PyReader;
     auto reader_cls = nb::class_<ReaderT>(m, "Reader")
                           .def(nb::init<>())
                           .def("open", [](ReaderT& reader, const std::string& filename) {
@@ -872,19 +1409,7 @@ NB_MODULE(_bcsv, m) {
                           .def("row_pos", &ReaderT::rowPos)
                           .def("version_string", [](ReaderT& r) { return r.fileHeader().versionString(); })
                           .def("creation_time", [](ReaderT& r) { return r.fileHeader().getCreationTime(); })
-                          .def("count_rows", [](ReaderT& reader) -> size_t {
-             if (!reader.isOpen())
-                 throw std::runtime_error("Reader is not open");
-             bcsv::ReaderDirectAccess<bcsv::Layout> da;
-             size_t count;
-             {
-                 nb::gil_scoped_release release;
-                 if (!da.open(reader.filePath(), true))
-                     throw std::runtime_error("Failed to open file for row counting: " + reader.filePath().string());
-                 count = da.rowCount();
-                 da.close();
-             }
-             return count; }, "Count the total number of rows in the file")
+                          .def("count_rows", &count_file_rows, "Count the total number of rows in the file")
                           .def("row_value", [](ReaderT& reader, size_t col) -> nb::object {
             const auto& layout = reader.layout();
             if (col >= layout.columnCount())
@@ -898,78 +1423,20 @@ NB_MODULE(_bcsv, m) {
                 result[nb::cast(layout.columnName(i))] =
                     extract_column_value(row, i, layout.columnType(i));
             return result; }, "Get the current row as a dict {column_name: value}")
-                          .def("read_batch", [](ReaderT& r, size_t batch_size) -> nb::object {
-            const auto& layout = r.layout();
-            const size_t num_cols = layout.columnCount();
-            if (num_cols == 0)
-                throw std::runtime_error("Reader has no columns");
-
-            // Cache column metadata
-            std::vector<bcsv::ColumnType> col_types(num_cols);
-            std::vector<std::string> col_names(num_cols);
-            std::vector<bool> is_str(num_cols, false);
-            for (size_t c = 0; c < num_cols; ++c) {
-                col_types[c] = layout.columnType(c);
-                col_names[c] = layout.columnName(c);
-                is_str[c] = (col_types[c] == bcsv::ColumnType::STRING);
-            }
-
-            // Allocate numpy arrays (numeric) and C++ string vectors (strings)
-            auto np = nb::module_::import_("numpy");
-            std::vector<nb::object> arrays(num_cols);
-            std::vector<void*> bufs(num_cols, nullptr);
-            std::vector<std::vector<std::string>> string_cols(num_cols);
-
-            for (size_t c = 0; c < num_cols; ++c) {
-                if (is_str[c]) {
-                    string_cols[c].reserve(batch_size);
-                } else {
-                    nb::object shape = nb::make_tuple(static_cast<int64_t>(batch_size));
-                    arrays[c] = np.attr("empty")(shape,
-                        "dtype"_a = bcsv_type_to_numpy_dtype(col_types[c]));
-                    bufs[c] = reinterpret_cast<void*>(
-                        nb::cast<intptr_t>(arrays[c].attr("ctypes").attr("data")));
-                }
-            }
-
-            // Read loop under GIL release
+                          .def("read_batch", [](ReaderT& r, size_t batch_size, bool raw_strings) -> nb::object {
             size_t rows_read = 0;
-            {
-                nb::gil_scoped_release release;
-                while (rows_read < batch_size && r.readNext()) {
-                    const auto& row = r.row();
-                    for (size_t c = 0; c < num_cols; ++c) {
-                        if (is_str[c]) {
-                            string_cols[c].emplace_back(row.template get<std::string>(c));
-                        } else {
-                            fill_numpy_cell(row, c, col_types[c], bufs[c], rows_read);
-                        }
-                    }
-                    ++rows_read;
-                }
-            }
-
+            nb::dict result = read_rows_columnar(r, batch_size, rows_read, raw_strings);
             if (rows_read == 0) return nb::none();
-
-            // Build result dict
-            nb::dict result;
-            for (size_t c = 0; c < num_cols; ++c) {
-                if (is_str[c]) {
-                    nb::list str_list;
-                    for (auto& s : string_cols[c])
-                        str_list.append(nb::cast(std::move(s)));
-                    result[nb::cast(col_names[c])] = std::move(str_list);
-                } else {
-                    if (rows_read < batch_size) {
-                        // Slice to actual row count
-                        auto stop = nb::int_(static_cast<int64_t>(rows_read));
-                        auto sl = nb::steal(PySlice_New(Py_None, stop.ptr(), Py_None));
-                        arrays[c] = arrays[c][sl];
-                    }
-                    result[nb::cast(col_names[c])] = std::move(arrays[c]);
-                }
-            }
-            return result; }, nb::arg("batch_size") = 10000, "Read up to batch_size rows into a dict of numpy arrays/lists. Returns None at EOF.");
+            return result; }, nb::arg("batch_size") = 10000, nb::arg("raw_strings") = false,
+            "Read up to batch_size rows into a dict of numpy arrays/lists. Returns None at EOF.\n\n"
+            "With raw_strings=True, string columns hold undecoded UTF-8 bytes.");
+    reader_cls.def("read_all_arrays", [](ReaderT& r, bool raw_strings) -> nb::dict {
+            const size_t total = count_file_rows(r);
+            const size_t remaining = total > r.rowPos() ? total - r.rowPos() : 0;
+            size_t rows_read = 0;
+            return read_rows_columnar(r, remaining, rows_read, raw_strings); }, nb::arg("raw_strings") = false,
+        "Read all remaining rows into a dict of numpy arrays (numeric) and lists (strings).\n\n"
+        "With raw_strings=True, string columns hold undecoded UTF-8 bytes.");
     bind_reader_iteration<ReaderT>(reader_cls);
     reader_cls.def("__repr__", [](ReaderT& r) {
         bool   open = r.isOpen();
@@ -1028,6 +1495,10 @@ NB_MODULE(_bcsv, m) {
                               .def("delimiter", &CsvReaderT::delimiter)
                               .def("decimal_separator", &CsvReaderT::decimalSeparator)
                               .def("error_msg", &CsvReaderT::getErrorMsg);
+    csv_reader_cls.def("read_all_arrays", [](CsvReaderT& r, bool raw_strings) -> nb::dict {
+            return read_all_columnar(r, 65536, raw_strings); }, nb::arg("raw_strings") = false,
+        "Read all remaining rows into a dict of numpy arrays (numeric) and lists (strings).\n\n"
+        "With raw_strings=True, string columns hold undecoded UTF-8 bytes.");
     bind_reader_iteration<CsvReaderT>(csv_reader_cls);
 
     // ── ReaderDirectAccess binding ─────────────────────────────────────
@@ -1166,7 +1637,7 @@ NB_MODULE(_bcsv, m) {
     // ── Sampler binding ────────────────────────────────────────────────
 
     nb::class_<bcsv::Sampler<bcsv::Layout>>(m, "Sampler")
-        .def(nb::init<bcsv::Reader<bcsv::Layout>&>(),
+        .def(nb::init<PyReader&>(),
              nb::arg("reader"), nb::keep_alive<1, 2>())
         .def("set_conditional", [](bcsv::Sampler<bcsv::Layout>& s, const std::string& expr) { return s.setConditional(expr); }, nb::arg("expr"))
         .def("get_conditional", &bcsv::Sampler<bcsv::Layout>::getConditional)
@@ -1283,11 +1754,7 @@ NB_MODULE(_bcsv, m) {
         nb::dict result;
         for (size_t c = 0; c < num_cols; ++c) {
             if (is_string[c]) {
-                nb::list str_list;
-                for (size_t i = 0; i < string_cols[c].size(); ++i) {
-                    str_list.append(nb::cast(std::move(string_cols[c][i])));
-                }
-                result[nb::cast(col_names[c])] = std::move(str_list);
+                result[nb::cast(col_names[c])] = string_list(string_cols[c]);
             } else {
                 result[nb::cast(col_names[c])] = std::move(arrays[c]);
             }
@@ -1320,26 +1787,11 @@ NB_MODULE(_bcsv, m) {
         std::vector<std::vector<std::string>> string_cols(num_cols);
         std::vector<bool> is_string(num_cols, false);
         size_t num_rows = 0;
-        auto np = nb::module_::import_("numpy");
 
         for (size_t c = 0; c < num_cols; ++c) {
-            nb::object col_data = columns[nb::cast(col_names[c])];
-            size_t col_len = 0;
-            if (col_types[c] == bcsv::ColumnType::STRING) {
-                is_string[c] = true;
-                nb::list str_list = nb::cast<nb::list>(col_data);
-                col_len = str_list.size();
-                string_cols[c].reserve(col_len);
-                for (size_t i = 0; i < col_len; ++i) {
-                    string_cols[c].emplace_back(nb::cast<std::string>(str_list[i]));
-                }
-            } else {
-                owned_arrays[c] = np.attr("ascontiguousarray")(col_data,
-                    "dtype"_a = bcsv_type_to_numpy_dtype(col_types[c]));
-                bufs[c] = reinterpret_cast<const void*>(
-                    nb::cast<intptr_t>(owned_arrays[c].attr("ctypes").attr("data")));
-                col_len = static_cast<size_t>(nb::cast<int64_t>(owned_arrays[c].attr("size")));
-            }
+            is_string[c] = col_types[c] == bcsv::ColumnType::STRING;
+            size_t col_len = gather_column(columns[nb::cast(col_names[c])], col_types[c], c,
+                                           owned_arrays[c], bufs[c], string_cols[c]);
             if (c == 0) {
                 num_rows = col_len;
             } else if (col_len != num_rows) {
@@ -239,6 +239,31 @@ def read_dataframe(filename: str,
         table = _read_to_arrow(filename, columns=columns)
         return table.to_pandas()
 
+    # Columnar path: C++ fills one typed numpy array per column, which the
+    # DataFrame adopts as-is (no per-cell Python objects, no astype pass)
+    if _COLUMNAR_AVAILABLE and optimize_dtypes:
+        data = _read_columns(filename)
+        if columns is not None:
+            column_set = set(columns)
+            missing_cols = column_set - data.keys()
+            if missing_cols:
+                warnings.warn(f"Columns not found in BCSV file: {missing_cols}", UserWarning)
+            data = {name: values for name, values in data.items() if name in column_set}
+        if not data or len(next(iter(data.values()))) == 0:
+            # No rows: empty string lists would become float64 columns, so
+            # take the dtypes from the layout as the row path does
+            with Reader() as reader:
+                reader.open(filename)
+                layout = reader.layout()
+                dtype_dict = {
+                    col_name: _get_pandas_dtype_from_bcsv_type(col_type)
+                    for col_name, col_type in zip(layout.get_column_names(),
+                                                  layout.get_column_types())
+                    if col_name in data
+                }
+            return pd.DataFrame(columns=list(data)).astype(dtype_dict)
+        return pd.DataFrame(data, copy=False)
+
     reader = Reader()
     try:
         if not reader.open(filename):
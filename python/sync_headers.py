@@ -14,25 +14,263 @@ Ensures both header (.h) and source (.c/.cpp) files are copied
 as needed for compilation.
 """
 
+import errno
+import logging
 import os
-import shutil
+import sys
+import threading
 import argparse
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
-def _copy_bcsv_headers(src_dir, dst_dir, exclude):
-    """Copy BCSV headers recursively, preserving subdirectory structure."""
-    dst_dir.mkdir(exist_ok=True)
-    for item in src_dir.iterdir():
-        if item.name in exclude:
+
+log = logging.getLogger("bcsv.sync")
+
+# Directory of this script (the python/ package root).
+_PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bytes requested per copy_file_range()/sendfile() call; the kernel clamps it.
+_COPY_CHUNK = 1 << 30
+
+# Buffer size of the userspace fallback copy.
+_COPY_BUFSIZE = 1 << 20
+
+# One reusable copy buffer per thread (Boost is copied on a thread pool).
+_copy_buffers = threading.local()
+
+# ioctl request number of FICLONE (linux/fs.h): share extents on btrfs/XFS.
+_FICLONE = 0x40049409
+
+# errno values meaning "this fast path is unsupported here", not a real failure.
+_FAST_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP}
+
+
+def _try_reflink(infd, outfd):
+    """Clone infd into outfd via FICLONE. Returns False if unsupported."""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(outfd, _FICLONE, infd)
+    except OSError:
+        return False
+    return True
+
+
+def _readinto_copy(fsrc, fdst):
+    """Copy fsrc to fdst through a preallocated 1 MiB buffer."""
+    buf = getattr(_copy_buffers, "buf", None)
+    if buf is None:
+        buf = _copy_buffers.buf = bytearray(_COPY_BUFSIZE)
+    with memoryview(buf) as mv:
+        while n := fsrc.readinto(mv):
+            fdst.write(mv[:n])
+
+
+def _kernel_copy(copy_chunk):
+    """
+    Call copy_chunk (a copy_file_range()/sendfile() wrapper) until it
+    reports end of file. Returns False if the call is unsupported here or
+    copies nothing on its first try: some kernels and filesystems return 0
+    for a non-empty file, so the caller must fall back to the next method
+    (like shutil's _GiveupOnFastCopy) rather than leave an empty copy.
+    """
+    try:
+        if not copy_chunk():
+            return False
+        while copy_chunk():
+            pass
+    except OSError as e:
+        if e.errno not in _FAST_COPY_UNSUPPORTED:
+            raise
+        return False
+    return True
+
+
+def _fast_copy(src, dst, src_stat=None):
+    """
+    Copy file contents and timestamps from src to dst.
+
+    Tries a copy-on-write reflink first, then in-kernel copy_file_range()
+    where available, then sendfile() on Linux, then a plain buffered copy.
+    Timestamps are taken from src_stat (an already captured stat result) so
+    no extra stat() call is needed. Copying a file onto itself is a no-op.
+    """
+    if src_stat is None:
+        src_stat = os.stat(src)
+    try:
+        if os.path.samestat(src_stat, os.stat(dst)):
+            return
+    except FileNotFoundError:
+        pass
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        done = _try_reflink(infd, outfd)
+        if not done and hasattr(os, "copy_file_range"):
+            done = _kernel_copy(lambda: os.copy_file_range(infd, outfd, _COPY_CHUNK))
+        if not done and sys.platform.startswith("linux"):
+            # Both calls advance the file offsets, so a fallback resumes
+            # wherever the previous attempt stopped.
+            done = _kernel_copy(lambda: os.sendfile(outfd, infd, None, _COPY_CHUNK))
+        if not done:
+            _readinto_copy(fsrc, fdst)
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+
+def _copy_tree_parallel(src_dir, dst_dir):
+    """
+    Copy a large directory tree using a thread pool.
+
+    Directories are created up front; the per-file copies are I/O bound and
+    release the GIL inside the copy syscalls, so they overlap well.
+    """
+    srcs, dsts = [], []
+    for root, dirs, files in os.walk(src_dir, followlinks=False):
+        target_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for name in files:
+            srcs.append(os.path.join(root, name))
+            dsts.append(os.path.join(target_root, name))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        # Drain the iterator so worker exceptions propagate.
+        list(ex.map(_fast_copy, srcs, dsts))
+
+
+def _tree_fingerprint(src_dir):
+    """
+    Return a cheap metadata-only fingerprint of a directory tree: the file
+    count and newest mtime, collected with cached DirEntry.stat() results.
+    """
+    count = 0
+    newest = 0
+    stack = [src_dir]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    count += 1
+                    newest = max(newest, entry.stat().st_mtime_ns)
+    return f"{count}:{newest}"
+
+
+def _manifest(root, exclude=()):
+    """
+    Map the path (relative to root) of every file under root to its stat
+    result. A missing root yields an empty manifest.
+    """
+    manifest = {}
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root, rel_dir))
+        except FileNotFoundError:
             continue
-        if item.is_dir():
-            _copy_bcsv_headers(item, dst_dir / item.name, exclude)
-        elif item.is_file():
-            shutil.copy2(item, dst_dir / item.name)
+        with it:
+            for entry in it:
+                if entry.name in exclude:
+                    continue
+                rel = os.path.join(rel_dir, entry.name)
+                if entry.is_dir():
+                    stack.append(rel)
+                elif entry.is_file():
+                    manifest[rel] = entry.stat()
+    return manifest
 
 
-def sync_headers(project_root=None, force=False, verbose=False):
+def _sync_tree(src_dir, dst_dir, exclude=(), force=False):
+    """
+    Bring dst_dir in line with src_dir, copying only files whose size or
+    mtime differ from their copy. Each file is written to a temporary name
+    and moved into place with os.replace(), so a concurrent build never
+    sees a half-written header. Returns the number of files copied.
+    """
+    src_m = _manifest(src_dir, exclude)
+    dst_m = {} if force else _manifest(dst_dir, exclude)
+    changed = 0
+    for rel, st in src_m.items():
+        old = dst_m.get(rel)
+        if old is not None and (old.st_size, old.st_mtime_ns) == (st.st_size, st.st_mtime_ns):
+            continue
+        dst = os.path.join(dst_dir, rel)
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = dst + ".sync-tmp"
+        _fast_copy(os.path.join(src_dir, rel), tmp, st)
+        os.replace(tmp, dst)
+        changed += 1
+    return changed
+
+
+def _same_dir(src_dir, dst_dir):
+    """Return True if dst_dir resolves to src_dir (symlink or junction)."""
+    return os.path.realpath(dst_dir) == os.path.realpath(src_dir)
+
+
+def _link_dir(src_dir, dst_dir):
+    """
+    Make dst_dir a directory symlink to src_dir, or a junction on Windows
+    when symlinks need privileges. Returns False if neither is possible.
+    """
+    src_dir = os.path.abspath(src_dir)
+    try:
+        os.symlink(src_dir, dst_dir, target_is_directory=True)
+        return True
+    except OSError:
+        if sys.platform != "win32":
+            return False
+    try:
+        import _winapi
+        _winapi.CreateJunction(src_dir, dst_dir)
+    except OSError:
+        return False
+    return True
+
+
+def _sync_files(src_dir, dst_dir, suffixes, names=(), force=False):
+    """
+    Copy the files directly inside src_dir whose suffix is in suffixes (or
+    whose name is in names) to dst_dir, skipping targets that are up to date.
+    """
+    os.makedirs(dst_dir, exist_ok=True)
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            # Name filter first: it needs no syscall, while is_file() may
+            # stat() on filesystems without d_type support.
+            if not entry.name.endswith(suffixes) and entry.name not in names:
+                continue
+            if not entry.is_file():
+                continue
+            target_file = os.path.join(dst_dir, entry.name)
+            src_stat = entry.stat()
+            if not force:
+                try:
+                    if src_stat.st_mtime <= os.stat(target_file).st_mtime:
+                        continue
+                except FileNotFoundError:
+                    pass
+            log.debug("  Copying %s", entry.name)
+            _fast_copy(entry.path, target_file, src_stat)
+
+
+def _configure_log(verbose):
+    """
+    Send log output to stdout as plain lines. Messages below the enabled
+    level are dropped before their %-arguments are formatted.
+    """
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+        log.propagate = False
+    log.setLevel(logging.DEBUG if verbose else logging.WARNING)
+
+
+def sync_headers(project_root=None, force=False, verbose=False, symlink=False):
     """
     Synchronize BCSV headers from the main project to the Python package.
     
@@ -40,145 +278,122 @@ def sync_headers(project_root=None, force=False, verbose=False):
         project_root: Path to the main BCSV project root (auto-detected if None)
         force: Force overwrite existing headers even if they're newer
         verbose: Print detailed information about what's being done
+        symlink: Link the Boost headers to the source tree instead of copying them
     """
+    _configure_log(verbose)
+
     # Get paths
-    python_dir = Path(__file__).parent.absolute()
+    python_dir = _PYTHON_DIR
     
     if project_root is None:
-        project_root = python_dir.parent
+        project_root = os.path.dirname(python_dir)
     else:
-        project_root = Path(project_root)
+        project_root = os.fspath(project_root)
     
-    source_include_dir = project_root / "include"
-    target_include_dir = python_dir / "include"
+    source_include_dir = os.path.join(project_root, "include")
+    target_include_dir = os.path.join(python_dir, "include")
     
-    if verbose:
-        print(f"Source include directory: {source_include_dir}")
-        print(f"Target include directory: {target_include_dir}")
+    log.info("Source include directory: %s", source_include_dir)
+    log.info("Target include directory: %s", target_include_dir)
     
     # Check if source exists
-    if not source_include_dir.exists():
-        print(f"Error: Source include directory not found: {source_include_dir}")
+    if not os.path.isdir(source_include_dir):
+        log.error("Error: Source include directory not found: %s", source_include_dir)
         return False
     
     # Create target directory if it doesn't exist
-    target_include_dir.mkdir(exist_ok=True)
+    os.makedirs(target_include_dir, exist_ok=True)
     
     # Archived headers excluded from Python sync (not part of active API)
     EXCLUDE_PATTERNS = {"row_view.h", "row_view.hpp"}
 
     # Sync BCSV headers
-    source_bcsv_dir = source_include_dir / "bcsv"
-    target_bcsv_dir = target_include_dir / "bcsv"
+    source_bcsv_dir = os.path.join(source_include_dir, "bcsv")
+    target_bcsv_dir = os.path.join(target_include_dir, "bcsv")
     
-    if source_bcsv_dir.exists():
-        if verbose:
-            print("Syncing BCSV headers...")
+    if os.path.isdir(source_bcsv_dir):
+        log.info("Syncing BCSV headers...")
         
-        if target_bcsv_dir.exists() and not force:
-            # Check if we need to update (recursive check)
-            source_newer = any(
-                not (target_bcsv_dir / f.relative_to(source_bcsv_dir)).exists() or 
-                f.stat().st_mtime > (target_bcsv_dir / f.relative_to(source_bcsv_dir)).stat().st_mtime
-                for f in source_bcsv_dir.rglob("*")
-                if f.is_file() and f.name not in EXCLUDE_PATTERNS
-            )
-            
-            if not source_newer:
-                if verbose:
-                    print("BCSV headers are up to date")
-            else:
-                if verbose:
-                    print("Updating BCSV headers...")
-                _copy_bcsv_headers(source_bcsv_dir, target_bcsv_dir, EXCLUDE_PATTERNS)
-        else:
-            if verbose:
-                print("Copying BCSV headers...")
-            _copy_bcsv_headers(source_bcsv_dir, target_bcsv_dir, EXCLUDE_PATTERNS)
+        changed = _sync_tree(source_bcsv_dir, target_bcsv_dir, EXCLUDE_PATTERNS, force=force)
+        log.info("  %s BCSV header(s) updated", changed)
     
     # Sync LZ4 headers AND sources (needed for compilation)
-    source_lz4_dir = source_include_dir / "lz4-1.10.0"
-    target_lz4_dir = target_include_dir / "lz4-1.10.0"
-    if source_lz4_dir.exists():
-        if verbose:
-            print("Syncing LZ4 headers and sources...")
-        target_lz4_dir.mkdir(exist_ok=True)
+    source_lz4_dir = os.path.join(source_include_dir, "lz4-1.10.0")
+    target_lz4_dir = os.path.join(target_include_dir, "lz4-1.10.0")
+    if os.path.isdir(source_lz4_dir):
+        log.info("Syncing LZ4 headers and sources...")
         # Copy all .h and .c files
-        for item in source_lz4_dir.glob("*"):
-            if item.is_file() and item.suffix in (".h", ".c"):
-                target_file = target_lz4_dir / item.name
-                if not target_file.exists() or force or item.stat().st_mtime > target_file.stat().st_mtime:
-                    if verbose: print(f"  Copying {item.name}")
-                    shutil.copy2(item, target_file)
+        _sync_files(source_lz4_dir, target_lz4_dir, (".h", ".c"), force=force)
     
     # Sync xxHash headers AND sources (needed for compilation)
-    source_xxhash_dir = source_include_dir / "xxHash-0.8.3"
-    target_xxhash_dir = target_include_dir / "xxHash-0.8.3"
-    if source_xxhash_dir.exists():
-        if verbose:
-            print("Syncing xxHash headers and sources...")
-        target_xxhash_dir.mkdir(exist_ok=True)
+    source_xxhash_dir = os.path.join(source_include_dir, "xxHash-0.8.3")
+    target_xxhash_dir = os.path.join(target_include_dir, "xxHash-0.8.3")
+    if os.path.isdir(source_xxhash_dir):
+        log.info("Syncing xxHash headers and sources...")
         # Copy all .h and .c files
-        for item in source_xxhash_dir.glob("*"):
-            if item.is_file() and item.suffix in (".h", ".c"):
-                target_file = target_xxhash_dir / item.name
-                if not target_file.exists() or force or item.stat().st_mtime > target_file.stat().st_mtime:
-                    if verbose: print(f"  Copying {item.name}")
-                    shutil.copy2(item, target_file)
+        _sync_files(source_xxhash_dir, target_xxhash_dir, (".h", ".c"), force=force)
 
     # Sync CLI11 header (needed by the bundled CLI tools)
-    source_cli11_dir = source_include_dir / "CLI11-2.6.2"
-    target_cli11_dir = target_include_dir / "CLI11-2.6.2"
-    if source_cli11_dir.exists():
-        if verbose:
-            print("Syncing CLI11 header...")
-        target_cli11_dir.mkdir(exist_ok=True)
-        for item in source_cli11_dir.glob("*"):
-            if item.is_file() and item.suffix in (".hpp", ".h") or item.name == "LICENSE":
-                target_file = target_cli11_dir / item.name
-                if not target_file.exists() or force or item.stat().st_mtime > target_file.stat().st_mtime:
-                    if verbose: print(f"  Copying {item.name}")
-                    shutil.copy2(item, target_file)
+    source_cli11_dir = os.path.join(source_include_dir, "CLI11-2.6.2")
+    target_cli11_dir = os.path.join(target_include_dir, "CLI11-2.6.2")
+    if os.path.isdir(source_cli11_dir):
+        log.info("Syncing CLI11 header...")
+        _sync_files(source_cli11_dir, target_cli11_dir, (".hpp", ".h"), names=("LICENSE",),
+                    force=force)
 
     # Sync CLI tool sources + shared helpers (compiled into the wheel and
     # installed into the scripts dir; see PYBCSV_TOOLS in CMakeLists.txt)
     for rel in ("src/tools", "src/shared"):
-        source_dir = project_root / rel
-        target_dir = python_dir / rel
-        if source_dir.exists():
-            if verbose:
-                print(f"Syncing {rel}...")
-            target_dir.mkdir(parents=True, exist_ok=True)
-            for item in source_dir.glob("*"):
-                if item.is_file() and item.suffix in (".cpp", ".h", ".hpp"):
-                    target_file = target_dir / item.name
-                    if not target_file.exists() or force or item.stat().st_mtime > target_file.stat().st_mtime:
-                        if verbose: print(f"  Copying {item.name}")
-                        shutil.copy2(item, target_file)
+        source_dir = os.path.join(project_root, rel)
+        target_dir = os.path.join(python_dir, rel)
+        if os.path.isdir(source_dir):
+            log.info("Syncing %s...", rel)
+            _sync_files(source_dir, target_dir, (".cpp", ".h", ".hpp"), force=force)
 
     # Sync boost headers if they exist
-    source_boost_dir = source_include_dir / "boost-1.89.0"
-    target_boost_dir = target_include_dir / "boost-1.89.0"
+    source_boost_dir = os.path.join(source_include_dir, "boost-1.89.0")
+    target_boost_dir = os.path.join(target_include_dir, "boost-1.89.0")
     
-    if source_boost_dir.exists():
-        if verbose:
-            print("Syncing Boost headers...")
+    if os.path.isdir(source_boost_dir):
+        log.info("Syncing Boost headers...")
         
-        if not target_boost_dir.exists() or force:
-            shutil.copytree(source_boost_dir, target_boost_dir, dirs_exist_ok=True)
-        elif verbose:
-            print("Boost headers already exist (use --force to update)")
+        if symlink and not os.path.lexists(target_boost_dir):
+            if not _link_dir(source_boost_dir, target_boost_dir):
+                log.warning("Cannot create a directory link; copying Boost headers instead")
+        elif symlink and not _same_dir(source_boost_dir, target_boost_dir):
+            log.warning("Keeping the existing Boost headers in %s; delete them to link "
+                        "to the source tree instead", target_boost_dir)
+
+        if _same_dir(source_boost_dir, target_boost_dir):
+            log.info("Boost headers are linked to %s", source_boost_dir)
+        else:
+            # Kept next to the Boost tree, not inside it, so the packaged
+            # headers contain no build artifact.
+            fingerprint_file = os.path.join(target_include_dir, ".boost_sync_fingerprint")
+            source_fp = _tree_fingerprint(source_boost_dir)
+            try:
+                with open(fingerprint_file) as f:
+                    target_fp = f.read().strip()
+            except OSError:
+                target_fp = None
+
+            if force or target_fp != source_fp or not os.path.isdir(target_boost_dir):
+                log.info("Copying Boost headers...")
+                _copy_tree_parallel(source_boost_dir, target_boost_dir)
+                # Written last, so an interrupted copy is redone on the next run.
+                with open(fingerprint_file, "w") as f:
+                    f.write(source_fp + "\n")
+            else:
+                log.info("Boost headers are up to date")
     
-    if verbose:
-        print("Header synchronization complete!")
+    log.info("Header synchronization complete!")
     
     # Sync VERSION.txt file for sdist builds (fallback when git is unavailable)
-    source_version_file = project_root / "VERSION.txt"
-    target_version_file = python_dir / "VERSION.txt"
-    if source_version_file.exists():
-        if verbose:
-            print("Syncing VERSION file...")
-        shutil.copy2(source_version_file, target_version_file)
+    source_version_file = os.path.join(project_root, "VERSION.txt")
+    target_version_file = os.path.join(python_dir, "VERSION.txt")
+    if os.path.isfile(source_version_file):
+        log.info("Syncing VERSION file...")
+        _fast_copy(source_version_file, target_version_file)
     
     return True
 
@@ -188,13 +403,16 @@ def main():
     parser.add_argument("--project-root", help="Path to the main BCSV project root")
     parser.add_argument("--force", action="store_true", help="Force overwrite existing headers")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--symlink", action="store_true",
+                        help="Symlink the Boost headers instead of copying them")
     
     args = parser.parse_args()
     
     success = sync_headers(
         project_root=args.project_root,
         force=args.force,
-        verbose=args.verbose
+        verbose=args.verbose,
+        symlink=args.symlink
     )
     
     if not success:
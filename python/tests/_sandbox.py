@@ -0,0 +1,39 @@
+# Copyright (c) 2025-2026 Tobias Weber <weber.tobias.md@gmail.com>
+#
+# This file is part of the BCSV library.
+#
+# Licensed under the MIT License. See LICENSE file in the project root
+# for full license information.
+
+"""
+Class-scoped temporary directory for the unittest-style test classes.
+"""
+
+import itertools
+import os
+import tempfile
+import unittest
+
+# Test files are written and read back, never kept; put them on tmpfs when
+# available so the suite does no disk I/O for them.
+SANDBOX_ROOT = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+class SandboxTestCase(unittest.TestCase):
+    """One temporary directory per class; tests get unique paths inside it."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._sandbox = tempfile.TemporaryDirectory(dir=SANDBOX_ROOT)
+        cls._counter = itertools.count()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove all files of the class in one rmtree."""
+        cls._sandbox.cleanup()
+        super().tearDownClass()
+
+    def _tmp(self, suffix=".bcsv"):
+        """Return a fresh file path inside the class temporary directory."""
+        return os.path.join(self._sandbox.name, f"f{next(self._counter)}{suffix}")
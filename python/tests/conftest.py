@@ -21,6 +21,8 @@ import pytest
 
 # ---------------------------------------------------------------------------
 # Ensure pybcsv is importable regardless of working directory.
+# This is the only place the tests touch sys.path; test modules just
+# ``import pybcsv`` so every module sees the same extension instance.
 # When running against an installed wheel (e.g. CI test-wheel), skip this
 # to avoid shadowing the installed package with the local source tree.
 # ---------------------------------------------------------------------------
@@ -35,6 +37,13 @@ except (ImportError, AttributeError):
     if _project_root not in sys.path:
         sys.path.insert(0, _project_root)
 
+# Shared test helpers (_sandbox) live next to this file. pytest's default
+# import mode already puts this directory on sys.path; add it here too so
+# they stay importable under --import-mode=importlib.
+_tests_dir = os.path.dirname(os.path.abspath(__file__))
+if _tests_dir not in sys.path:
+    sys.path.insert(0, _tests_dir)
+
 
 # ---------------------------------------------------------------------------
 # Shared fixtures
@@ -15,69 +15,106 @@ import unittest
 import tempfile
 import os
 import numpy as np
+import pytest
 import pybcsv
 from typing import List, Any
 
 
+# One column of every supported type, shared by the layout and round-trip tests
+ALL_TYPE_COLUMNS = [
+    ("bool_col", pybcsv.BOOL),
+    ("int8_col", pybcsv.INT8),
+    ("int16_col", pybcsv.INT16),
+    ("int32_col", pybcsv.INT32),
+    ("int64_col", pybcsv.INT64),
+    ("uint8_col", pybcsv.UINT8),
+    ("uint16_col", pybcsv.UINT16),
+    ("uint32_col", pybcsv.UINT32),
+    ("uint64_col", pybcsv.UINT64),
+    ("float_col", pybcsv.FLOAT),
+    ("double_col", pybcsv.DOUBLE),
+    ("string_col", pybcsv.STRING),
+]
+
+# Boundary values per column of ALL_TYPE_COLUMNS, four rows each
+ALL_TYPE_VALUES = {
+    "bool_col": [True, False, True, False],
+    "int8_col": [-128, 127, 0, -1],
+    "int16_col": [-32768, 32767, 0, -1],
+    "int32_col": [-2147483648, 2147483647, 0, -1],
+    "int64_col": [-9223372036854775808, 9223372036854775807, 0, -1],
+    "uint8_col": [0, 255, 128, 1],
+    "uint16_col": [0, 65535, 32768, 1],
+    "uint32_col": [0, 4294967295, 2147483648, 1],
+    "uint64_col": [0, 18446744073709551615, 9223372036854775808, 1],
+    "float_col": [1.5, -1.5, 0.0, float('inf')],
+    "double_col": [2.5, -2.5, 0.0, float('-inf')],
+    "string_col": ["hello", "world", "", "unicode: 🚀 测试"],
+}
+
+
+def _assert_column_equal(actual, col_type, expected):
+    """Compare one read_all_arrays column against a list of Python values."""
+    if col_type == pybcsv.STRING:
+        assert actual == list(expected)
+    else:
+        np.testing.assert_array_equal(actual, np.array(expected, dtype=actual.dtype))
+
+
+@pytest.mark.parametrize("column_set",
+                         [[column] for column in ALL_TYPE_COLUMNS] + [ALL_TYPE_COLUMNS],
+                         ids=[name for name, _ in ALL_TYPE_COLUMNS] + ["all"])
+def test_type_round_trip(column_set, tmp_bcsv):
+    """Each column type, alone and all together, round-trips its boundary values."""
+    layout = pybcsv.Layout()
+    for name, col_type in column_set:
+        layout.add_column(name, col_type)
+    # One row per list position
+    rows = [list(row) for row in zip(*(ALL_TYPE_VALUES[name] for name, _ in column_set))]
+    
+    with pybcsv.Writer(layout) as writer:
+        writer.open(tmp_bcsv)
+        writer.write_rows(rows)
+    
+    with pybcsv.Reader() as reader:
+        reader.open(tmp_bcsv)
+        columns = reader.read_all_arrays()
+    
+    for name, col_type in column_set:
+        _assert_column_equal(columns[name], col_type, ALL_TYPE_VALUES[name])
+
+
 class TestBasicFunctionality(unittest.TestCase):
     """Test basic BCSV functionality and API."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_files = []
+    @classmethod
+    def setUpClass(cls):
+        """Build the all-types layout once; tests only read it."""
+        cls.all_types_layout = pybcsv.Layout()
+        for name, col_type in ALL_TYPE_COLUMNS:
+            cls.all_types_layout.add_column(name, col_type)
 
-    def tearDown(self):
-        """Clean up temporary files."""
-        for filepath in self.temp_files:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
+    def setUp(self):
+        """Set up a per-test temporary directory, removed in one rmtree."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self._file_count = 0
 
     def _create_temp_file(self, suffix='.bcsv') -> str:
-        """Create a temporary file path and track it for cleanup."""
-        fd, filepath = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
-        os.unlink(filepath)  # Remove so writer.open() creates fresh
-        self.temp_files.append(filepath)
-        return filepath
+        """Return a fresh file path inside the test's temporary directory."""
+        self._file_count += 1
+        return os.path.join(self.temp_dir, f"test_{self._file_count}{suffix}")
 
     def test_layout_creation(self):
         """Test layout creation with different column types."""
-        layout = pybcsv.Layout()
-        
-        # Add various column types
-        layout.add_column("bool_col", pybcsv.BOOL)
-        layout.add_column("int8_col", pybcsv.INT8)
-        layout.add_column("int16_col", pybcsv.INT16)
-        layout.add_column("int32_col", pybcsv.INT32)
-        layout.add_column("int64_col", pybcsv.INT64)
-        layout.add_column("uint8_col", pybcsv.UINT8)
-        layout.add_column("uint16_col", pybcsv.UINT16)
-        layout.add_column("uint32_col", pybcsv.UINT32)
-        layout.add_column("uint64_col", pybcsv.UINT64)
-        layout.add_column("float_col", pybcsv.FLOAT)
-        layout.add_column("double_col", pybcsv.DOUBLE)
-        layout.add_column("string_col", pybcsv.STRING)
+        layout = self.all_types_layout
         
         # Verify layout properties
         self.assertEqual(layout.column_count(), 12)
         
         # Check column names and types
-        expected_columns = [
-            ("bool_col", pybcsv.BOOL),
-            ("int8_col", pybcsv.INT8),
-            ("int16_col", pybcsv.INT16),
-            ("int32_col", pybcsv.INT32),
-            ("int64_col", pybcsv.INT64),
-            ("uint8_col", pybcsv.UINT8),
-            ("uint16_col", pybcsv.UINT16),
-            ("uint32_col", pybcsv.UINT32),
-            ("uint64_col", pybcsv.UINT64),
-            ("float_col", pybcsv.FLOAT),
-            ("double_col", pybcsv.DOUBLE),
-            ("string_col", pybcsv.STRING),
-        ]
-        
-        for i, (expected_name, expected_type) in enumerate(expected_columns):
+        for i, (expected_name, expected_type) in enumerate(ALL_TYPE_COLUMNS):
             self.assertEqual(layout.column_name(i), expected_name)
             self.assertEqual(layout.column_type(i), expected_type)
 
@@ -124,63 +161,6 @@ class TestBasicFunctionality(unittest.TestCase):
         for i, (original, read) in enumerate(zip(test_data, read_data)):
             self.assertEqual(original, read, f"Row {i} mismatch")
 
-    def test_all_column_types(self):
-        """Test reading and writing all supported column types."""
-        filepath = self._create_temp_file()
-        
-        # Create layout with all types
-        layout = pybcsv.Layout()
-        layout.add_column("bool_val", pybcsv.BOOL)
-        layout.add_column("int8_val", pybcsv.INT8)
-        layout.add_column("int16_val", pybcsv.INT16)
-        layout.add_column("int32_val", pybcsv.INT32)
-        layout.add_column("int64_val", pybcsv.INT64)
-        layout.add_column("uint8_val", pybcsv.UINT8)
-        layout.add_column("uint16_val", pybcsv.UINT16)
-        layout.add_column("uint32_val", pybcsv.UINT32)
-        layout.add_column("uint64_val", pybcsv.UINT64)
-        layout.add_column("float_val", pybcsv.FLOAT)
-        layout.add_column("double_val", pybcsv.DOUBLE)
-        layout.add_column("string_val", pybcsv.STRING)
-        
-        # Test data with boundary values
-        test_data = [
-            [True, -128, -32768, -2147483648, -9223372036854775808, 
-             0, 0, 0, 0, 1.5, 2.5, "hello"],
-            [False, 127, 32767, 2147483647, 9223372036854775807,
-             255, 65535, 4294967295, 18446744073709551615, -1.5, -2.5, "world"],
-            [True, 0, 0, 0, 0, 128, 32768, 2147483648, 9223372036854775808,
-             0.0, 0.0, ""],
-            [False, -1, -1, -1, -1, 1, 1, 1, 1, 
-             float('inf'), float('-inf'), "unicode: 🚀 测试"]
-        ]
-        
-        # Write data
-        writer = pybcsv.Writer(layout)
-        self.assertTrue(writer.open(filepath))
-        
-        for row in test_data:
-            writer.write_row(row)
-        
-        writer.close()
-        
-        # Read data back
-        reader = pybcsv.Reader()
-        self.assertTrue(reader.open(filepath))
-        
-        read_data = reader.read_all()
-        reader.close()
-        
-        # Verify data (with special handling for inf values)
-        self.assertEqual(len(read_data), len(test_data))
-        for i, (original, read) in enumerate(zip(test_data, read_data)):
-            for j, (orig_val, read_val) in enumerate(zip(original, read)):
-                if isinstance(orig_val, float) and np.isinf(orig_val):
-                    self.assertTrue(np.isinf(read_val), f"Row {i}, col {j}: expected inf, got {read_val}")
-                    self.assertEqual(np.sign(orig_val), np.sign(read_val), f"Row {i}, col {j}: inf sign mismatch")
-                else:
-                    self.assertEqual(orig_val, read_val, f"Row {i}, col {j}: {orig_val} != {read_val}")
-
     def test_batch_operations(self):
         """Test batch write operations."""
         filepath = self._create_temp_file()
@@ -192,26 +172,29 @@ class TestBasicFunctionality(unittest.TestCase):
         
         # Generate test data
         batch_size = 100
-        test_data = [[i, i * 1.5] for i in range(batch_size)]
+        rows = np.empty(batch_size, dtype=np.dtype([('id', '<i4'), ('value', '<f8')]))
+        rows['id'] = np.arange(batch_size, dtype=np.int32)
+        rows['value'] = rows['id'] * 1.5
         
         # Write using batch operation
         writer = pybcsv.Writer(layout)
         self.assertTrue(writer.open(filepath))
         
-        writer.write_rows(test_data)
+        writer.write_rows(rows)
         writer.close()
         
-        # Read data back
+        # Read data back in chunks (the last one partial)
         reader = pybcsv.Reader()
         self.assertTrue(reader.open(filepath))
         
-        read_data = reader.read_all()
+        start = 0
+        for chunk in pybcsv.iter_batches(reader, batch_size=32):
+            stop = start + len(chunk["id"])
+            np.testing.assert_array_equal(chunk["id"], rows["id"][start:stop])
+            np.testing.assert_array_equal(chunk["value"], rows["value"][start:stop])
+            start = stop
         reader.close()
-        
-        # Verify data
-        self.assertEqual(len(read_data), batch_size)
-        for i, (original, read) in enumerate(zip(test_data, read_data)):
-            self.assertEqual(original, read, f"Row {i} mismatch")
+        self.assertEqual(start, batch_size)
 
     def test_context_managers(self):
         """Test that writers and readers work as context managers."""
@@ -314,13 +297,13 @@ class TestBasicFunctionality(unittest.TestCase):
         writer.write_row(test_data[0])
         writer.close()
         
+        # Compare as raw UTF-8 bytes; skips decoding the 64 KB cell
         reader = pybcsv.Reader()
         reader.open(filepath)
-        read_data = reader.read_all()
+        read_data = reader.read_all_arrays(raw_strings=True)
         reader.close()
         
-        self.assertEqual(read_data, test_data)
-        self.assertEqual(len(read_data[0][0]), 65527)
+        self.assertEqual(read_data["large_string"], [max_string.encode()])
         
         # Test string at MAX_STRING_LENGTH (65535) — should still fit
         max_limit_string = "x" * 65535
@@ -336,7 +319,7 @@ class TestBasicFunctionality(unittest.TestCase):
         self.assertEqual(len(read_data[0][0]), 65535)
         
         # Test string that exceeds MAX_STRING_LENGTH (should be rejected)
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaises(pybcsv.ValidationError) as context:
             writer = pybcsv.Writer(layout)
             writer.open(filepath, overwrite=True)
             oversized_string = "x" * 65536  # Exceeds uint16_t max string length
@@ -346,7 +329,7 @@ class TestBasicFunctionality(unittest.TestCase):
         self.assertIn("exceeds maximum length", str(context.exception))
         
         # Test string that is much larger (should be rejected)
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaises(pybcsv.ValidationError) as context:
             writer = pybcsv.Writer(layout)
             writer.open(filepath, overwrite=True)
             huge_string = "x" * 100000  # Well beyond MAX_STRING_LENGTH
@@ -356,11 +339,13 @@ class TestBasicFunctionality(unittest.TestCase):
         self.assertIn("exceeds maximum length", str(context.exception))
         
         # Test that excessively large strings are handled gracefully by our Python bindings
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaises(pybcsv.ValidationError) as context:
             writer = pybcsv.Writer(layout)
             writer.open(filepath, overwrite=True)
-            # Try to write a 200MB string (should fail at Python level)
-            huge_string = "x" * (200 * 1024 * 1024)
+            # Try to write a 200MB cell (should fail at Python level). A
+            # zero-filled bytes object is calloc'd and never touched, since
+            # the bindings reject it from its size alone.
+            huge_string = bytes(200 * 1024 * 1024)
             writer.write_row([huge_string])
             writer.close()
         
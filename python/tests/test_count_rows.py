@@ -2,9 +2,10 @@
 """Test count_rows functionality in pybcsv."""
 
 import tempfile
+import contextlib
 import os
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
 import pybcsv
 
 
@@ -25,12 +26,14 @@ def test_count_rows():
         
         try:
             # Write test data
+            ids = np.arange(expected_rows, dtype=np.int32)
             writer = pybcsv.Writer(layout)
             writer.open(temp_file, overwrite=True)
-            
-            for i in range(expected_rows):
-                writer.write_row([i, f'item_{i}', i * 2.5])
-            
+            writer.write_columns({
+                "id": ids,
+                "name": np.char.add('item_', ids.astype('U')),
+                "value": ids * 2.5,
+            })
             writer.close()
             
             # Test count_rows
@@ -40,24 +43,49 @@ def test_count_rows():
             counted_rows = reader.count_rows()
             
             # Verify by reading all and counting
-            all_rows = list(reader.read_all())
-            actual_rows = len(all_rows)
+            columns = reader.read_all_arrays()
+            actual_rows = len(columns["id"])
             
             reader.close()
             
             # Assertions
             assert counted_rows == expected_rows, f"count_rows() returned {counted_rows}, expected {expected_rows}"
-            assert actual_rows == expected_rows, f"read_all() returned {actual_rows} rows, expected {expected_rows}"
-            assert counted_rows == actual_rows, f"count_rows() and read_all() mismatch: {counted_rows} vs {actual_rows}"
+            assert actual_rows == expected_rows, f"read_all_arrays() returned {actual_rows} rows, expected {expected_rows}"
+            assert counted_rows == actual_rows, f"count_rows() and read_all_arrays() mismatch: {counted_rows} vs {actual_rows}"
             
-            print(f"✅ {expected_rows} rows: count_rows() = {counted_rows}, read_all() = {actual_rows}")
+            print(f"✅ {expected_rows} rows: count_rows() = {counted_rows}, read_all_arrays() = {actual_rows}")
             
         finally:
-            if os.path.exists(temp_file):
+            with contextlib.suppress(FileNotFoundError):
                 os.unlink(temp_file)
     
     print("🎉 count_rows tests passed!")
 
 
+def test_count_rows_reopen(tmp_dir):
+    """count_rows() is cached per open file and refreshed on reopen."""
+    layout = pybcsv.Layout()
+    layout.add_column("id", pybcsv.ColumnType.INT32)
+
+    paths = []
+    for n in (3, 7):
+        path = os.path.join(tmp_dir, f"rows_{n}.bcsv")
+        writer = pybcsv.Writer(layout)
+        writer.open(path, overwrite=True)
+        writer.write_rows([[i] for i in range(n)])
+        writer.close()
+        paths.append(path)
+
+    reader = pybcsv.Reader()
+    reader.open(paths[0])
+    assert reader.count_rows() == 3
+    assert reader.count_rows() == 3
+    reader.close()
+
+    reader.open(paths[1])
+    assert reader.count_rows() == 7
+    reader.close()
+
+
 if __name__ == "__main__":
     test_count_rows()
\ No newline at end of file
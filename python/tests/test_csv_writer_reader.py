@@ -37,6 +37,29 @@ def _make_layout(*cols):
     return layout
 
 
+@pytest.fixture(scope="module")
+def layouts():
+    """Layouts shared by every test in this module, built once."""
+    return {
+        "mixed": _make_layout(
+            ("id", pybcsv.ColumnType.INT32),
+            ("name", pybcsv.ColumnType.STRING),
+            ("score", pybcsv.ColumnType.FLOAT),
+        ),
+        "int_x": _make_layout(("x", pybcsv.ColumnType.INT32)),
+        "int_xy": _make_layout(
+            ("x", pybcsv.ColumnType.INT32),
+            ("y", pybcsv.ColumnType.INT32),
+        ),
+        "int_a": _make_layout(("a", pybcsv.ColumnType.INT32)),
+        "int_str": _make_layout(
+            ("a", pybcsv.ColumnType.INT32),
+            ("b", pybcsv.ColumnType.STRING),
+        ),
+        "double_v": _make_layout(("v", pybcsv.ColumnType.DOUBLE)),
+    }
+
+
 # ---------------------------------------------------------------------------
 # CsvWriter / CsvReader round-trip
 # ---------------------------------------------------------------------------
@@ -44,13 +67,9 @@ def _make_layout(*cols):
 class TestCsvRoundTrip:
     """Write CSV with CsvWriter, read back with CsvReader, compare."""
 
-    def test_basic_round_trip(self, tmp_path):
+    def test_basic_round_trip(self, tmp_path, layouts):
         path = str(tmp_path / "basic.csv")
-        layout = _make_layout(
-            ("id", pybcsv.ColumnType.INT32),
-            ("name", pybcsv.ColumnType.STRING),
-            ("score", pybcsv.ColumnType.FLOAT),
-        )
+        layout = layouts["mixed"]
 
         rows = [
             [1, "alice", 9.5],
@@ -74,9 +93,9 @@ class TestCsvRoundTrip:
         assert len(data) == 3
         assert data[0][1] == "alice"
 
-    def test_context_manager(self, tmp_path):
+    def test_context_manager(self, tmp_path, layouts):
         path = str(tmp_path / "ctx.csv")
-        layout = _make_layout(("x", pybcsv.ColumnType.INT32))
+        layout = layouts["int_x"]
 
         with pybcsv.CsvWriter(layout) as w:
             w.open(path)
@@ -88,9 +107,9 @@ class TestCsvRoundTrip:
             lines = f.read().strip().splitlines()
         assert len(lines) == 2  # header + 1 row
 
-    def test_row_count(self, tmp_path):
+    def test_row_count(self, tmp_path, layouts):
         path = str(tmp_path / "count.csv")
-        layout = _make_layout(("v", pybcsv.ColumnType.DOUBLE))
+        layout = layouts["double_v"]
 
         writer = pybcsv.CsvWriter(layout)
         writer.open(path)
@@ -100,9 +119,9 @@ class TestCsvRoundTrip:
         assert writer.row_count() == 2
         writer.close()
 
-    def test_write_rows_batch(self, tmp_path):
+    def test_write_rows_batch(self, tmp_path, layouts):
         path = str(tmp_path / "batch.csv")
-        layout = _make_layout(("a", pybcsv.ColumnType.INT32))
+        layout = layouts["int_a"]
 
         writer = pybcsv.CsvWriter(layout)
         writer.open(path)
@@ -110,12 +129,9 @@ class TestCsvRoundTrip:
         assert writer.row_count() == 100
         writer.close()
 
-    def test_delimiter(self, tmp_path):
+    def test_delimiter(self, tmp_path, layouts):
         path = str(tmp_path / "semicolon.csv")
-        layout = _make_layout(
-            ("a", pybcsv.ColumnType.INT32),
-            ("b", pybcsv.ColumnType.STRING),
-        )
+        layout = layouts["int_str"]
 
         writer = pybcsv.CsvWriter(layout, delimiter=';')
         writer.open(path)
@@ -139,28 +155,37 @@ class TestCsvReader:
             w.writerow(header)
             w.writerows(rows)
 
-    def test_read_simple(self, tmp_path):
+    def test_read_simple(self, tmp_path, layouts):
         path = str(tmp_path / "simple.csv")
         self._write_csv(path, ["x", "y"], [[1, 2], [3, 4]])
 
-        layout = _make_layout(
-            ("x", pybcsv.ColumnType.INT32),
-            ("y", pybcsv.ColumnType.INT32),
-        )
+        layout = layouts["int_xy"]
 
         reader = pybcsv.CsvReader(layout)
         reader.open(path)
-        rows = []
-        row = reader.read_row()
-        while row is not None:
-            rows.append(row)
-            row = reader.read_row()
+        columns = reader.read_all_arrays()
+        reader.close()
+        assert columns["x"].tolist() == [1, 3]
+        assert columns["y"].tolist() == [2, 4]
+
+    def test_read_all_arrays_multiple_chunks(self, tmp_path, layouts):
+        # More rows than one internal read chunk, so the chunks get joined
+        path = str(tmp_path / "many.csv")
+        n = 70000
+        self._write_csv(path, ["a", "b"], ([i, f"s{i}"] for i in range(n)))
+
+        reader = pybcsv.CsvReader(layouts["int_str"])
+        reader.open(path)
+        columns = reader.read_all_arrays()
         reader.close()
-        assert len(rows) == 2
+        assert columns["a"].tolist() == list(range(n))
+        assert columns["b"][0] == "s0"
+        assert columns["b"][-1] == f"s{n - 1}"
+        assert len(columns["b"]) == n
 
-    def test_reader_nonexistent_file(self, tmp_path):
+    def test_reader_nonexistent_file(self, tmp_path, layouts):
         path = str(tmp_path / "does_not_exist.csv")
-        layout = _make_layout(("x", pybcsv.ColumnType.INT32))
+        layout = layouts["int_x"]
 
         reader = pybcsv.CsvReader(layout)
         with pytest.raises(RuntimeError):
@@ -8,33 +8,68 @@
 import unittest
 import os
 import tempfile
+import numpy as np
 import pybcsv
 
+
+def _make_layout(*cols):
+    """Build a Layout from (name, type) pairs."""
+    layout = pybcsv.Layout()
+    for name, col_type in cols:
+        layout.add_column(name, col_type)
+    return layout
+
+
 class TestDataTypes(unittest.TestCase):
     """Test various data type handling in BCSV."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build the layouts once per class; tests never modify them."""
+        cls.int_layout = _make_layout(
+            ("int8_col", pybcsv.ColumnType.INT8),
+            ("int16_col", pybcsv.ColumnType.INT16),
+            ("int32_col", pybcsv.ColumnType.INT32),
+            ("int64_col", pybcsv.ColumnType.INT64),
+            ("uint8_col", pybcsv.ColumnType.UINT8),
+            ("uint16_col", pybcsv.ColumnType.UINT16),
+            ("uint32_col", pybcsv.ColumnType.UINT32),
+            ("uint64_col", pybcsv.ColumnType.UINT64),
+        )
+        cls.float_layout = _make_layout(
+            ("float_col", pybcsv.ColumnType.FLOAT),
+            ("double_col", pybcsv.ColumnType.DOUBLE),
+        )
+        cls.bool_layout = _make_layout(("bool_col", pybcsv.ColumnType.BOOL))
+        cls.string_layout = _make_layout(("string_col", pybcsv.ColumnType.STRING))
+        cls.mixed_layout = _make_layout(
+            ("id", pybcsv.ColumnType.INT32),
+            ("name", pybcsv.ColumnType.STRING),
+            ("score", pybcsv.ColumnType.DOUBLE),
+            ("active", pybcsv.ColumnType.BOOL),
+            ("count", pybcsv.ColumnType.UINT16),
+            ("rating", pybcsv.ColumnType.FLOAT),
+        )
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.temp_dir, "test.bcsv")
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.test_file = os.path.join(temp_dir.name, "test.bcsv")
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-        os.rmdir(self.temp_dir)
+    def _round_trip(self, layout, write):
+        """Write through write(writer) and return the columns read back."""
+        with pybcsv.Writer(layout) as writer:
+            writer.open(self.test_file, overwrite=True, compression_level=0)
+            write(writer)
+        
+        with pybcsv.Reader() as reader:
+            reader.open(self.test_file)
+            return reader.read_all_arrays()
     
     def test_integer_types(self):
         """Test all integer types."""
-        layout = pybcsv.Layout()
-        layout.add_column("int8_col", pybcsv.ColumnType.INT8)
-        layout.add_column("int16_col", pybcsv.ColumnType.INT16)
-        layout.add_column("int32_col", pybcsv.ColumnType.INT32)
-        layout.add_column("int64_col", pybcsv.ColumnType.INT64)
-        layout.add_column("uint8_col", pybcsv.ColumnType.UINT8)
-        layout.add_column("uint16_col", pybcsv.ColumnType.UINT16)
-        layout.add_column("uint32_col", pybcsv.ColumnType.UINT32)
-        layout.add_column("uint64_col", pybcsv.ColumnType.UINT64)
+        layout = self.int_layout
         
         test_data = [
             [-128, -32768, -2147483648, -9223372036854775808,
@@ -44,57 +79,52 @@ class TestDataTypes(unittest.TestCase):
             [0, 0, 0, 0, 128, 32768, 2147483648, 9223372036854775808]
         ]
         
-        with pybcsv.Writer(layout) as writer:
-            writer.open(self.test_file, compression_level=0)
-            for row in test_data:
-                writer.write_row(row)
-        
-        with pybcsv.Reader() as reader:
-            reader.open(self.test_file)
-            read_data = reader.read_all()
-        
-        self.assertEqual(len(read_data), len(test_data))
-        for original, read_back in zip(test_data, read_data):
-            self.assertEqual(original, read_back)
+        rows = np.array([tuple(r) for r in test_data], dtype=np.dtype([
+            ('int8_col', 'i1'), ('int16_col', '<i2'),
+            ('int32_col', '<i4'), ('int64_col', '<i8'),
+            ('uint8_col', 'u1'), ('uint16_col', '<u2'),
+            ('uint32_col', '<u4'), ('uint64_col', '<u8'),
+        ]))
+        
+        # The structured-array bulk path and the per-row conversion of
+        # Python ints must both carry the boundary values unchanged
+        writes = {"structured": lambda w: w.write_rows(rows),
+                  "rows": lambda w: w.write_rows(test_data)}
+        for path, write in writes.items():
+            with self.subTest(path=path):
+                columns = self._round_trip(layout, write)
+                for name in rows.dtype.names:
+                    np.testing.assert_array_equal(columns[name], rows[name], err_msg=name)
     
     def test_float_types(self):
         """Test float and double types."""
-        layout = pybcsv.Layout()
-        layout.add_column("float_col", pybcsv.ColumnType.FLOAT)
-        layout.add_column("double_col", pybcsv.ColumnType.DOUBLE)
+        layout = self.float_layout
         
-        test_data = [
-            [1.5, 1.5],
-            [-3.14159, -3.141592653589793],
-            [0.0, 0.0],
-            [float('inf'), float('inf')],
-            [float('-inf'), float('-inf')],
-        ]
+        special = [1.5, -3.141592653589793, 0.0, -0.0,
+                   float('inf'), float('-inf'), float('nan')]
+        floats = np.array(special, dtype=np.float32)
+        doubles = np.array(special, dtype=np.float64)
         
         with pybcsv.Writer(layout) as writer:
             writer.open(self.test_file, compression_level=0)
-            for row in test_data:
-                writer.write_row(row)
+            writer.write_rows([[value, value] for value in special])
         
         with pybcsv.Reader() as reader:
             reader.open(self.test_file)
-            read_data = reader.read_all()
-        
-        self.assertEqual(len(read_data), len(test_data))
-        for i, (original, read_back) in enumerate(zip(test_data, read_data)):
-            # For regular numbers, check equality
-            if i < 3:
-                self.assertAlmostEqual(original[0], read_back[0], places=6)
-                self.assertAlmostEqual(original[1], read_back[1], places=15)
-            # For infinity values, check special cases
-            else:
-                self.assertEqual(str(original[0]), str(read_back[0]))
-                self.assertEqual(str(original[1]), str(read_back[1]))
+            columns = reader.read_all_arrays()
+        
+        self.assertEqual(columns["float_col"].dtype, np.float32)
+        self.assertEqual(columns["double_col"].dtype, np.float64)
+        # Compare bit patterns: exact for inf, -0.0 and NaN, so a lossy
+        # Python float -> float/double cell conversion would show up here
+        np.testing.assert_array_equal(columns["float_col"].view(np.uint32),
+                                      floats.view(np.uint32))
+        np.testing.assert_array_equal(columns["double_col"].view(np.uint64),
+                                      doubles.view(np.uint64))
     
     def test_boolean_type(self):
         """Test boolean type."""
-        layout = pybcsv.Layout()
-        layout.add_column("bool_col", pybcsv.ColumnType.BOOL)
+        layout = self.bool_layout
         
         test_data = [
             [True],
@@ -110,16 +140,14 @@ class TestDataTypes(unittest.TestCase):
         
         with pybcsv.Reader() as reader:
             reader.open(self.test_file)
-            read_data = reader.read_all()
+            columns = reader.read_all_arrays()
         
-        self.assertEqual(len(read_data), len(test_data))
-        for original, read_back in zip(test_data, read_data):
-            self.assertEqual(original, read_back)
+        np.testing.assert_array_equal(
+            columns["bool_col"], np.array([row[0] for row in test_data]))
     
     def test_string_type(self):
         """Test string type with various content."""
-        layout = pybcsv.Layout()
-        layout.add_column("string_col", pybcsv.ColumnType.STRING)
+        layout = self.string_layout
         
         test_data = [
             ["Hello, World!"],
@@ -138,21 +166,13 @@ class TestDataTypes(unittest.TestCase):
         
         with pybcsv.Reader() as reader:
             reader.open(self.test_file)
-            read_data = reader.read_all()
+            columns = reader.read_all_arrays()
         
-        self.assertEqual(len(read_data), len(test_data))
-        for original, read_back in zip(test_data, read_data):
-            self.assertEqual(original, read_back)
+        self.assertEqual(columns["string_col"], [row[0] for row in test_data])
     
     def test_mixed_types(self):
         """Test a layout with mixed data types."""
-        layout = pybcsv.Layout()
-        layout.add_column("id", pybcsv.ColumnType.INT32)
-        layout.add_column("name", pybcsv.ColumnType.STRING)
-        layout.add_column("score", pybcsv.ColumnType.DOUBLE)
-        layout.add_column("active", pybcsv.ColumnType.BOOL)
-        layout.add_column("count", pybcsv.ColumnType.UINT16)
-        layout.add_column("rating", pybcsv.ColumnType.FLOAT)
+        layout = self.mixed_layout
         
         test_data = [
             [1, "Alice", 95.5, True, 100, 4.5],
@@ -162,26 +182,26 @@ class TestDataTypes(unittest.TestCase):
             [2147483647, "Very long name " * 10, 
              999999.999999, True, 65535, 5.0],  # Max values
         ]
+        ids, names, scores, active, counts, ratings = zip(*test_data)
+        columns = {
+            "id": np.array(ids, dtype=np.int32),
+            "name": list(names),
+            "score": np.array(scores, dtype=np.float64),
+            "active": np.array(active, dtype=np.bool_),
+            "count": np.array(counts, dtype=np.uint16),
+            "rating": np.array(ratings, dtype=np.float32),
+        }
         
-        with pybcsv.Writer(layout) as writer:
-            writer.open(self.test_file, compression_level=0)
-            for row in test_data:
-                writer.write_row(row)
-        
-        with pybcsv.Reader() as reader:
-            reader.open(self.test_file)
-            read_data = reader.read_all()
-        
-        self.assertEqual(len(read_data), len(test_data))
-        for i, (original, read_back) in enumerate(zip(test_data, read_data)):
-            self.assertEqual(len(original), len(read_back))
-            # Check each field
-            self.assertEqual(original[0], read_back[0])  # id
-            self.assertEqual(original[1], read_back[1])  # name
-            self.assertAlmostEqual(original[2], read_back[2], places=10)  # score
-            self.assertEqual(original[3], read_back[3])  # active
-            self.assertEqual(original[4], read_back[4])  # count
-            self.assertAlmostEqual(original[5], read_back[5], places=6)  # rating
+        # Columnar bulk path and per-row conversion of Python values
+        writes = {"columns": lambda w: w.write_columns(columns),
+                  "rows": lambda w: w.write_rows(test_data)}
+        for path, write in writes.items():
+            with self.subTest(path=path):
+                read_columns = self._round_trip(layout, write)
+                self.assertEqual(read_columns["name"], columns["name"])
+                for name in ("id", "score", "active", "count", "rating"):
+                    np.testing.assert_array_equal(read_columns[name], columns[name],
+                                                  err_msg=name)
     
     def test_type_to_string(self):
         """Test the type_to_string utility function."""
@@ -5,11 +5,11 @@ Tests boundary conditions, memory usage, performance characteristics, and edge c
 """
 
 import unittest
-import tempfile
 import os
 import time
 import gc
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 try:
@@ -21,47 +21,33 @@ except ImportError:
     HAS_PANDAS = False
 
 import pybcsv
+from _sandbox import SandboxTestCase
 from typing import List, Any
 import tracemalloc
 
 
 @unittest.skipUnless(HAS_PANDAS, "pandas not installed")
-class TestPerformanceEdgeCases(unittest.TestCase):
+class TestPerformanceEdgeCases(SandboxTestCase):
     """Test performance characteristics and edge cases."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_files = []
-
-    def tearDown(self):
-        """Clean up temporary files."""
-        for filepath in self.temp_files:
-            if os.path.exists(filepath):
-                os.unlink(filepath)
-
-    def _create_temp_file(self, suffix=".bcsv") -> str:
-        """Create a temporary file path and track it for cleanup."""
-        fd, filepath = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
-        os.unlink(filepath)  # Remove so writer.open() creates fresh
-        self.temp_files.append(filepath)
-        return filepath
-
     def test_boundary_values(self):
         """Test boundary values for all numeric types."""
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
-        layout = pybcsv.Layout()
-        layout.add_column("int8_val", pybcsv.INT8)
-        layout.add_column("int16_val", pybcsv.INT16)
-        layout.add_column("int32_val", pybcsv.INT32)
-        layout.add_column("int64_val", pybcsv.INT64)
-        layout.add_column("uint8_val", pybcsv.UINT8)
-        layout.add_column("uint16_val", pybcsv.UINT16)
-        layout.add_column("uint32_val", pybcsv.UINT32)
-        layout.add_column("uint64_val", pybcsv.UINT64)
-        layout.add_column("float_val", pybcsv.FLOAT)
-        layout.add_column("double_val", pybcsv.DOUBLE)
+        layout = pybcsv.Layout.from_dtype(
+            [
+                ("int8_val", "i1"),
+                ("int16_val", "i2"),
+                ("int32_val", "i4"),
+                ("int64_val", "i8"),
+                ("uint8_val", "u1"),
+                ("uint16_val", "u2"),
+                ("uint32_val", "u4"),
+                ("uint64_val", "u8"),
+                ("float_val", "f4"),
+                ("double_val", "f8"),
+            ]
+        )
 
         # Test boundary values
         boundary_data = [
@@ -124,25 +110,23 @@ class TestPerformanceEdgeCases(unittest.TestCase):
 
         self.assertEqual(len(read_data), len(boundary_data))
 
-        # Verify each row (with tolerance for floating point)
-        for i, (original, read) in enumerate(zip(boundary_data, read_data)):
-            for j, (orig_val, read_val) in enumerate(zip(original, read)):
-                if j >= 8:  # Float/double columns
-                    if abs(orig_val) > 1e30:  # Very large numbers
-                        # Allow relative error for very large numbers
-                        self.assertAlmostEqual(read_val / orig_val, 1.0, places=3)
-                    else:
-                        self.assertAlmostEqual(read_val, orig_val, places=5)
-                else:
-                    self.assertEqual(
-                        read_val,
-                        orig_val,
-                        f"Row {i}, col {j}: {read_val} != {orig_val}",
-                    )
+        # Verify column-wise: integers exactly (object dtype keeps uint64 max),
+        # the float column at float32 precision, the double column exactly
+        expected = np.asarray(boundary_data, dtype=object)
+        actual = np.asarray(read_data, dtype=object)
+        np.testing.assert_array_equal(actual[:, :8], expected[:, :8])
+        np.testing.assert_allclose(
+            actual[:, 8].astype(np.float32),
+            expected[:, 8].astype(np.float32),
+            rtol=1e-6,
+        )
+        np.testing.assert_array_equal(
+            actual[:, 9].astype(np.float64), expected[:, 9].astype(np.float64)
+        )
 
     def test_very_large_dataset(self):
         """Test handling of very large datasets."""
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
         # Create layout for performance test
         layout = pybcsv.Layout()
@@ -154,8 +138,11 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         n_rows = 50000
         print(f"Testing with {n_rows} rows...")
 
-        # Generate data in chunks to avoid memory issues
+        # Build the columns once as arrays and write them in chunks
         chunk_size = 1000
+        ids = np.arange(n_rows, dtype=np.int32)
+        data = np.char.add("data_row_", ids.astype(str))
+        values = ids * 0.5
 
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
@@ -163,13 +150,10 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         start_time = time.time()
 
         for chunk_start in range(0, n_rows, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, n_rows)
-            chunk_data = []
-
-            for i in range(chunk_start, chunk_end):
-                chunk_data.append([i, f"data_row_{i}", i * 0.5])
-
-            writer.write_rows(chunk_data)
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            writer.write_columns(
+                {"id": ids[chunk], "data": data[chunk], "value": values[chunk]}
+            )
 
         writer.close()
         write_time = time.time() - start_time
@@ -178,12 +162,15 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         start_time = time.time()
         reader = pybcsv.Reader()
         reader.open(filepath)
-        read_data = reader.read_all()
+        read_cols = reader.read_all_arrays()
         reader.close()
         read_time = time.time() - start_time
 
-        # Verify data
-        self.assertEqual(len(read_data), n_rows)
+        # Verify data column-wise
+        self.assertEqual(len(read_cols["id"]), n_rows)
+        np.testing.assert_array_equal(read_cols["id"], ids)
+        np.testing.assert_array_equal(read_cols["value"], values)
+        self.assertEqual(read_cols["data"], data.tolist())
 
         # Check file size
         file_size = os.path.getsize(filepath)
@@ -204,7 +191,7 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         if not hasattr(tracemalloc, "start"):
             self.skipTest("tracemalloc not available")
 
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
         layout = pybcsv.Layout()
         layout.add_column("id", pybcsv.INT32)
@@ -217,15 +204,18 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         n_rows = 5000
         test_data = [[i, f"test_string_{i}"] for i in range(n_rows)]
 
-        # Measure memory during write
-        snapshot1 = tracemalloc.take_snapshot()
+        # Measure memory during write; only totals are needed, so read the
+        # current/peak counters instead of taking full snapshots
+        before_write, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
 
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
         writer.write_rows(test_data)
         writer.close()
 
-        snapshot2 = tracemalloc.take_snapshot()
+        after_write, write_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
 
         # Measure memory during read
         reader = pybcsv.Reader()
@@ -233,36 +223,31 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         read_data = reader.read_all()
         reader.close()
 
-        snapshot3 = tracemalloc.take_snapshot()
+        after_read, read_peak = tracemalloc.get_traced_memory()
 
         # Clean up data
         del test_data
         del read_data
         gc.collect()
 
-        snapshot4 = tracemalloc.take_snapshot()
+        after_cleanup, _ = tracemalloc.get_traced_memory()
 
         tracemalloc.stop()
 
-        # Check memory stats
-        write_stats = snapshot2.compare_to(snapshot1, "lineno")
-        read_stats = snapshot3.compare_to(snapshot2, "lineno")
-        cleanup_stats = snapshot4.compare_to(snapshot3, "lineno")
-
         print("Memory usage during operations:")
         print(
-            f"Write phase: {sum(stat.size_diff for stat in write_stats[:10]) / 1024:.2f} KB"
-        )
-        print(
-            f"Read phase: {sum(stat.size_diff for stat in read_stats[:10]) / 1024:.2f} KB"
+            f"Write phase: {(after_write - before_write) / 1024:.2f} KB "
+            f"(peak {(write_peak - before_write) / 1024:.2f} KB)"
         )
         print(
-            f"Cleanup: {sum(stat.size_diff for stat in cleanup_stats[:10]) / 1024:.2f} KB"
+            f"Read phase: {(after_read - after_write) / 1024:.2f} KB "
+            f"(peak {(read_peak - after_write) / 1024:.2f} KB)"
         )
+        print(f"Cleanup: {(after_cleanup - after_read) / 1024:.2f} KB")
 
     def test_string_edge_cases(self):
         """Test edge cases with string handling."""
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
         layout = pybcsv.Layout()
         layout.add_column("test_string", pybcsv.STRING)
@@ -277,7 +262,7 @@ class TestPerformanceEdgeCases(unittest.TestCase):
             '"',  # Quote
             "'",  # Single quote
             "\\",  # Backslash
-            "\x00",  # Null character (may not work)
+            "\x00",  # Null character (strings are length-prefixed)
             "a" * 1000,  # Long string
             "🚀" * 100,  # Unicode emoji repeated
             "\U0001f600\U0001f601\U0001f602",  # Multiple Unicode
@@ -288,19 +273,10 @@ class TestPerformanceEdgeCases(unittest.TestCase):
 
         test_data = [[s] for s in edge_case_strings]
 
-        # Write edge cases
+        # Write all edge cases in one batch; every one of them is valid
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
-
-        for i, row in enumerate(test_data):
-            try:
-                writer.write_row(row)
-            except (ValueError, RuntimeError) as e:
-                print(
-                    f"String edge case {i} failed (acceptable): {repr(edge_case_strings[i])}"
-                )
-                # Some edge cases may legitimately fail
-
+        writer.write_rows(test_data)
         writer.close()
 
         # Read back and verify what was written
@@ -309,12 +285,11 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         read_data = reader.read_all()
         reader.close()
 
-        # At least some strings should have been written successfully
-        self.assertGreater(len(read_data), 0)
+        self.assertEqual(read_data, test_data)
 
     def test_concurrent_readers(self):
         """Test multiple concurrent readers on the same file."""
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
         # Create test file
         layout = pybcsv.Layout()
@@ -335,11 +310,9 @@ class TestPerformanceEdgeCases(unittest.TestCase):
             self.assertTrue(reader.open(filepath))
             readers.append(reader)
 
-        # Read from all readers
-        all_data = []
-        for reader in readers:
-            data = reader.read_all()
-            all_data.append(data)
+        # Read from all readers at once; read_all releases the GIL while decoding
+        with ThreadPoolExecutor(max_workers=len(readers)) as pool:
+            all_data = list(pool.map(lambda r: r.read_all(), readers))
 
         # Close all readers
         for reader in readers:
@@ -351,8 +324,9 @@ class TestPerformanceEdgeCases(unittest.TestCase):
 
     def test_performance_batch_vs_individual(self):
         """Test performance difference between batch and individual operations."""
-        filepath_batch = self._create_temp_file(".batch.bcsv")
-        filepath_individual = self._create_temp_file(".individual.bcsv")
+        filepath_batch = self._tmp(".batch.bcsv")
+        filepath_individual = self._tmp(".individual.bcsv")
+        filepath_columns = self._tmp(".columns.bcsv")
 
         layout = pybcsv.Layout()
         layout.add_column("id", pybcsv.INT32)
@@ -379,33 +353,49 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         writer_individual.close()
         individual_time = time.perf_counter() - start_time
 
-        # Verify both files have same data
-        reader1 = pybcsv.Reader()
-        reader1.open(filepath_batch)
-        data1 = reader1.read_all()
-        reader1.close()
-
-        reader2 = pybcsv.Reader()
-        reader2.open(filepath_individual)
-        data2 = reader2.read_all()
-        reader2.close()
+        # Test columnar write from typed arrays
+        ids = np.arange(n_rows, dtype=np.int32)
+        values = ids * 1.5
+        start_time = time.perf_counter()
+        writer_columns = pybcsv.Writer(layout)
+        writer_columns.open(filepath_columns)
+        writer_columns.write_columns({"id": ids, "value": values})
+        writer_columns.close()
+        columns_time = time.perf_counter() - start_time
+
+        # Verify all files have same data. Compare decoded columns rather
+        # than file bytes: the header stores the creation time.
+        def read_columns(path):
+            reader = pybcsv.Reader()
+            reader.open(path)
+            cols = reader.read_all_arrays()
+            reader.close()
+            return cols
 
-        self.assertEqual(data1, data2)
+        expected = read_columns(filepath_batch)
+        for path in (filepath_individual, filepath_columns):
+            actual = read_columns(path)
+            self.assertEqual(actual.keys(), expected.keys())
+            for name in expected:
+                np.testing.assert_array_equal(actual[name], expected[name])
 
         # Batch should be faster (guard against zero-time on fast CI)
         if batch_time > 0:
             speedup = individual_time / batch_time
             print(f"Batch time: {batch_time:.4f}s")
             print(f"Individual time: {individual_time:.4f}s")
+            print(f"Columns time: {columns_time:.4f}s")
             print(f"Speedup: {speedup:.2f}x")
         else:
             print(f"Batch time: {batch_time:.6f}s (too fast to measure)")
             print(f"Individual time: {individual_time:.6f}s")
+            print(f"Columns time: {columns_time:.6f}s")
 
         # Note: For small datasets, batch operations may not show significant speedup
-        # due to overhead. We just verify both methods produce identical output.
+        # due to overhead. We just verify all methods produce identical output.
         self.assertGreaterEqual(batch_time, 0)
         self.assertGreaterEqual(individual_time, 0)
+        self.assertGreaterEqual(columns_time, 0)
 
     def test_compression_effectiveness(self):
         """Test compression effectiveness with different data patterns."""
@@ -413,18 +403,19 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         # Test highly repetitive data (should compress well)
         repetitive_data = [["same_string"] for _ in range(1000)]
 
-        # Test random data (should compress poorly)
-        import random
-
-        random_data = [[f"random_{random.randint(0, 999999)}"] for _ in range(1000)]
+        # Test random data (should compress poorly): fixed-width 6-digit IDs,
+        # generated vectorized from a seeded generator for reproducible sizes
+        rng = np.random.default_rng(0)
+        random_ids = np.char.zfill(rng.integers(0, 1000000, 1000).astype(str), 6)
+        random_strs = np.char.add("random_", random_ids)
+        random_data = [[s] for s in random_strs.tolist()]
 
-        # Test mixed data
-        mixed_data = []
-        for i in range(500):
-            if i % 2 == 0:
-                mixed_data.append(["repetitive"])
-            else:
-                mixed_data.append([f"unique_{i}"])
+        # Test mixed data: "repetitive" on even rows, "unique_<i>" on odd rows
+        # object dtype: a fixed-width str array would silently truncate the
+        # assigned "repetitive" to its width
+        mixed_strs = np.char.add("unique_", np.arange(500).astype(str)).astype(object)
+        mixed_strs[::2] = "repetitive"
+        mixed_data = [[s] for s in mixed_strs.tolist()]
 
         layout = pybcsv.Layout()
         layout.add_column("data", pybcsv.STRING)
@@ -437,7 +428,7 @@ class TestPerformanceEdgeCases(unittest.TestCase):
 
         for name, data in test_cases:
             for compression_level in [1, 9]:
-                filepath = self._create_temp_file(
+                filepath = self._tmp(
                     f".{name}_comp{compression_level}.bcsv"
                 )
 
@@ -461,7 +452,7 @@ class TestPerformanceEdgeCases(unittest.TestCase):
 
     def test_zero_length_fields(self):
         """Test handling of zero-length and minimal data."""
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
         # Test with minimal layout and data
         layout = pybcsv.Layout()
@@ -488,7 +479,7 @@ class TestPerformanceEdgeCases(unittest.TestCase):
 
     def test_file_size_limits(self):
         """Test behavior near file size limits."""
-        filepath = self._create_temp_file()
+        filepath = self._tmp()
 
         layout = pybcsv.Layout()
         layout.add_column("data", pybcsv.STRING)
@@ -499,17 +490,11 @@ class TestPerformanceEdgeCases(unittest.TestCase):
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
 
-        # Write until we have a reasonably large file (limit to avoid test timeouts)
-        max_rows = 1000  # This should create ~10MB file
-        for i in range(max_rows):
-            writer.write_row([f"{large_string}_{i}"])
-
-            # Check file size periodically
-            if i % 100 == 0:
-                writer.flush()
-                current_size = os.path.getsize(filepath)
-                if current_size > 50 * 1024 * 1024:  # Stop at 50MB
-                    break
+        # Write ~10MB of raw row data (limit to avoid test timeouts). This stays
+        # far below any size limit, so no periodic flush/stat polling is needed
+        # and the writer keeps its full packets.
+        max_rows = 1000
+        writer.write_rows([f"{large_string}_{i}"] for i in range(max_rows))
 
         writer.close()
 
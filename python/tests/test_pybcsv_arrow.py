@@ -13,6 +13,7 @@ Tests read_to_arrow and write_from_arrow interop via pyarrow.
 
 import unittest
 import tempfile
+import contextlib
 import os
 
 import pybcsv
@@ -239,7 +240,7 @@ class TestArrowRoundTrip(unittest.TestCase):
             self.assertTrue(t1.equals(t2))
         finally:
             for p in (path1, path2):
-                if os.path.exists(p):
+                with contextlib.suppress(FileNotFoundError):
                     os.unlink(p)
 
     def test_roundtrip_large(self):
@@ -256,7 +257,7 @@ class TestArrowRoundTrip(unittest.TestCase):
             self.assertEqual(t1.column("i").to_pylist(), t2.column("i").to_pylist())
         finally:
             for p in (path1, path2):
-                if os.path.exists(p):
+                with contextlib.suppress(FileNotFoundError):
                     os.unlink(p)
 
     def test_arrow_to_pandas(self):
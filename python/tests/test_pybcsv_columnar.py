@@ -53,6 +53,23 @@ class TestColumnarIO(unittest.TestCase):
         finally:
             os.unlink(path)
 
+    def test_read_columns_strings(self):
+        """ASCII, multi-byte UTF-8 and empty cells in one string column."""
+        path = _tmp()
+        try:
+            texts = ["plain", "", "café", "中文", "🚀 emoji", "x" * 300]
+            pybcsv.write_columns(path, {"s": texts}, ["s"], [pybcsv.ColumnType.STRING])
+
+            result = pybcsv.read_columns(path)
+            self.assertEqual(result["s"], texts)
+
+            with pybcsv.Reader() as reader:
+                reader.open(path)
+                raw = reader.read_all_arrays(raw_strings=True)["s"]
+            self.assertEqual(raw, [t.encode("utf-8") for t in texts])
+        finally:
+            os.unlink(path)
+
     def test_read_columns_numeric_types(self):
         """Test all numeric types through columnar I/O."""
         path = _tmp()
@@ -14,6 +14,7 @@ batch operations, compression, and string limits.
 
 import unittest
 import tempfile
+import contextlib
 import os
 
 import numpy as np
@@ -66,6 +67,35 @@ class TestLayoutCreation(unittest.TestCase):
             self.assertEqual(layout.column_name(i), expected_name)
             self.assertEqual(layout.column_type(i), expected_type)
 
+    def test_layout_from_dtype(self):
+        layout = pybcsv.Layout.from_dtype(
+            [
+                ("bool_col", "?"),
+                ("int8_col", "i1"),
+                ("uint64_col", "u8"),
+                ("float_col", "f4"),
+                ("double_col", "f8"),
+                ("str_col", "U8"),
+                ("obj_col", "O"),
+            ]
+        )
+        self.assertEqual(
+            [(layout.column_name(i), layout.column_type(i)) for i in range(len(layout))],
+            [
+                ("bool_col", pybcsv.BOOL),
+                ("int8_col", pybcsv.INT8),
+                ("uint64_col", pybcsv.UINT64),
+                ("float_col", pybcsv.FLOAT),
+                ("double_col", pybcsv.DOUBLE),
+                ("str_col", pybcsv.STRING),
+                ("obj_col", pybcsv.STRING),
+            ],
+        )
+        with self.assertRaises(TypeError):
+            pybcsv.Layout.from_dtype("f8")
+        with self.assertRaises(RuntimeError):
+            pybcsv.Layout.from_dtype([("c", "c16")])
+
 
 class TestSimpleWriteRead(unittest.TestCase):
     """Test basic write/read operations."""
@@ -75,7 +105,7 @@ class TestSimpleWriteRead(unittest.TestCase):
 
     def tearDown(self):
         for fp in self.temp_files:
-            if os.path.exists(fp):
+            with contextlib.suppress(FileNotFoundError):
                 os.unlink(fp)
 
     def _tmp(self, suffix=".bcsv"):
@@ -235,6 +265,25 @@ class TestSimpleWriteRead(unittest.TestCase):
         for i, (original, read) in enumerate(zip(test_data, read_data)):
             self.assertEqual(original, read, f"Row {i} mismatch")
 
+    def test_batch_operations_from_generator(self):
+        filepath = self._tmp()
+        layout = pybcsv.Layout()
+        layout.add_column("id", pybcsv.INT32)
+        layout.add_column("value", pybcsv.DOUBLE)
+
+        batch_size = 100
+        writer = pybcsv.Writer(layout)
+        self.assertTrue(writer.open(filepath))
+        writer.write_rows((i, i * 1.5) for i in range(batch_size))
+        writer.close()
+
+        reader = pybcsv.Reader()
+        self.assertTrue(reader.open(filepath))
+        read_data = reader.read_all()
+        reader.close()
+
+        self.assertEqual(read_data, [[i, i * 1.5] for i in range(batch_size)])
+
     def test_context_managers(self):
         filepath = self._tmp()
         layout = pybcsv.Layout()
@@ -323,24 +372,24 @@ class TestSimpleWriteRead(unittest.TestCase):
         reader.close()
         self.assertEqual(len(read_data[0][0]), 65535)
 
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaises(pybcsv.ValidationError) as context:
             writer = pybcsv.Writer(layout)
             writer.open(filepath, overwrite=True)
             writer.write_row(["x" * 65536])
             writer.close()
         self.assertIn("exceeds maximum length", str(context.exception))
 
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaises(pybcsv.ValidationError) as context:
             writer = pybcsv.Writer(layout)
             writer.open(filepath, overwrite=True)
             writer.write_row(["x" * 100000])
             writer.close()
         self.assertIn("exceeds maximum length", str(context.exception))
 
-        with self.assertRaises(RuntimeError) as context:
+        with self.assertRaises(pybcsv.ValidationError) as context:
             writer = pybcsv.Writer(layout)
             writer.open(filepath, overwrite=True)
-            writer.write_row(["x" * (200 * 1024 * 1024)])
+            writer.write_row([bytes(200 * 1024 * 1024)])  # calloc'd, never touched
             writer.close()
         self.assertIn("exceeds maximum length", str(context.exception))
 
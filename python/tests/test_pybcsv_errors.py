@@ -14,24 +14,97 @@ concurrent access, large strings, and invalid parameters.
 # for full license information.
 
 import os
-import tempfile
+import shutil
 import unittest
 
 import pybcsv
-
-
-class TestErrorHandling(unittest.TestCase):
+from _sandbox import SandboxTestCase
+
+_IS_POSIX = os.name == 'posix'
+
+
+# Column sets of the layouts the tests write, built once per class
+_LAYOUT_COLUMNS = {
+    "int32": [("test", pybcsv.ColumnType.INT32)],
+    "int_str": [("col1", pybcsv.ColumnType.INT32),
+                ("col2", pybcsv.ColumnType.STRING)],
+    "int_bool_double": [("int_col", pybcsv.ColumnType.INT32),
+                        ("bool_col", pybcsv.ColumnType.BOOL),
+                        ("float_col", pybcsv.ColumnType.DOUBLE)],
+    "id_name": [("id", pybcsv.ColumnType.INT32),
+                ("name", pybcsv.ColumnType.STRING)],
+    "int_str_double": [("col1", pybcsv.ColumnType.INT32),
+                       ("col2", pybcsv.ColumnType.STRING),
+                       ("col3", pybcsv.ColumnType.DOUBLE)],
+    "mixed4": [("int_col", pybcsv.ColumnType.INT32),
+               ("string_col", pybcsv.ColumnType.STRING),
+               ("double_col", pybcsv.ColumnType.DOUBLE),
+               ("bool_col", pybcsv.ColumnType.BOOL)],
+    "narrow_ints": [("int8_col", pybcsv.ColumnType.INT8),
+                    ("uint8_col", pybcsv.ColumnType.UINT8),
+                    ("int32_col", pybcsv.ColumnType.INT32)],
+    "large_string": [("large_string", pybcsv.ColumnType.STRING)],
+}
+
+
+def _make_layout(*cols):
+    """Build a Layout from (name, type) pairs."""
+    layout = pybcsv.Layout()
+    for name, col_type in cols:
+        layout.add_column(name, col_type)
+    return layout
+
+
+def _write_int_rows(path, count):
+    """Write rows [0] .. [count - 1] to a single INT32 column."""
+    layout = _make_layout(("value", pybcsv.ColumnType.INT32))
+    with pybcsv.Writer(layout) as writer:
+        writer.open(path, compression_level=0)
+        writer.write_rows([[i] for i in range(count)])
+
+
+class _ErrorTestCase(SandboxTestCase):
+    """Sandbox plus the shared layouts and lazily built input files."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._fixtures = {}
+        # Shared, never mutated: writers only read the layout they are given
+        cls.LAYOUTS = {key: _make_layout(*cols) for key, cols in _LAYOUT_COLUMNS.items()}
+
+    @classmethod
+    def _fixture(cls, key, build):
+        """Return a read-only input file, built by build(path) once per class."""
+        path = cls._fixtures.get(key)
+        if path is None:
+            path = os.path.join(cls._sandbox.name, f"fixture_{key}.bcsv")
+            build(path)
+            cls._fixtures[key] = path
+        return path
+
+
+class TestErrorHandling(_ErrorTestCase):
     """Test error handling and edge cases."""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_file = os.path.join(self.temp_dir, "test.bcsv")
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Shared read-only (traversable, not writable) directory
+        cls.readonly_dir = os.path.join(cls._sandbox.name, "readonly")
+        os.mkdir(cls.readonly_dir)
+        if _IS_POSIX:
+            os.chmod(cls.readonly_dir, 0o555)
+
+    @classmethod
+    def tearDownClass(cls):
+        if _IS_POSIX:
+            os.chmod(cls.readonly_dir, 0o755)
+        super().tearDownClass()
 
-    def tearDown(self):
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-        if os.path.exists(self.temp_dir):
-            os.rmdir(self.temp_dir)
+    def setUp(self):
+        self.temp_dir = self._sandbox.name
+        self.test_file = self._tmp()
 
     def test_invalid_file_read(self):
         non_existent = os.path.join(self.temp_dir, "does_not_exist.bcsv")
@@ -41,8 +114,7 @@ class TestErrorHandling(unittest.TestCase):
 
     def test_invalid_file_write(self):
         invalid_path = "/invalid/path/that/does/not/exist/test.bcsv"
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.ColumnType.INT32)
+        layout = self.LAYOUTS["int32"]
         with self.assertRaises(Exception):
             pybcsv.Writer(invalid_path, layout)
 
@@ -60,59 +132,41 @@ class TestErrorHandling(unittest.TestCase):
             self.assertEqual(len(data), 1)
 
     def test_row_length_mismatch(self):
-        layout = pybcsv.Layout()
-        layout.add_column("col1", pybcsv.ColumnType.INT32)
-        layout.add_column("col2", pybcsv.ColumnType.STRING)
+        layout = self.LAYOUTS["int_str"]
 
         with pybcsv.Writer(layout) as writer:
             writer.open(self.test_file, compression_level=0)
             writer.write_row([1, "test"])
-            try:
+            with self.assertRaises(pybcsv.ValidationError):
                 writer.write_row([1])
-            except Exception:
-                pass
-            try:
+            with self.assertRaises(pybcsv.ValidationError):
                 writer.write_row([1, "test", "extra"])
-            except Exception:
-                pass
 
     def test_wrong_data_types(self):
-        layout = pybcsv.Layout()
-        layout.add_column("int_col", pybcsv.ColumnType.INT32)
-        layout.add_column("bool_col", pybcsv.ColumnType.BOOL)
-        layout.add_column("float_col", pybcsv.ColumnType.DOUBLE)
+        layout = self.LAYOUTS["int_bool_double"]
 
         with pybcsv.Writer(layout) as writer:
             writer.open(self.test_file, compression_level=0)
             writer.write_row([1, True, 1.5])
             writer.write_row([1.0, False, 2])
             writer.write_row(["1", "True", "3.14"])
-            try:
+            with self.assertRaises(pybcsv.ValidationError):
                 writer.write_row(["not_a_number", True, 1.5])
-            except Exception:
-                pass
-
-    def test_file_permissions(self):
-        if os.name != 'posix':
-            self.skipTest("File permission test only on POSIX systems")
-        readonly_dir = os.path.join(self.temp_dir, "readonly")
-        os.makedirs(readonly_dir)
-        os.chmod(readonly_dir, 0o444)
 
-        readonly_file = os.path.join(readonly_dir, "test.bcsv")
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.ColumnType.INT32)
+    def test_validation_error_hierarchy(self):
+        # Existing `except ValueError` / `except RuntimeError` handlers still apply
+        self.assertTrue(issubclass(pybcsv.ValidationError, ValueError))
+        self.assertTrue(issubclass(pybcsv.ValidationError, RuntimeError))
 
-        try:
-            with self.assertRaises(Exception):
-                pybcsv.Writer(readonly_file, layout)
-        finally:
-            os.chmod(readonly_dir, 0o755)
-            os.rmdir(readonly_dir)
+    @unittest.skipUnless(_IS_POSIX, "File permission test only on POSIX systems")
+    def test_file_permissions(self):
+        readonly_file = os.path.join(self.readonly_dir, "test.bcsv")
+        layout = self.LAYOUTS["int32"]
+        with self.assertRaises(Exception):
+            pybcsv.Writer(readonly_file, layout)
 
     def test_context_manager_exceptions(self):
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.ColumnType.INT32)
+        layout = self.LAYOUTS["int32"]
         try:
             with pybcsv.Writer(layout) as writer:
                 writer.open(self.test_file, compression_level=0)
@@ -129,65 +183,40 @@ class TestErrorHandling(unittest.TestCase):
             self.assertEqual(data[0], [1])
 
     def test_reader_iteration_after_end(self):
-        layout = pybcsv.Layout()
-        layout.add_column("value", pybcsv.ColumnType.INT32)
-        with pybcsv.Writer(layout) as writer:
-            writer.open(self.test_file, compression_level=0)
-            for i in range(3):
-                writer.write_row([i])
+        path = self._fixture("int32_3rows", lambda p: _write_int_rows(p, 3))
 
         with pybcsv.Reader() as reader:
-            reader.open(self.test_file)
+            reader.open(path)
             rows = list(reader)
             self.assertEqual(len(rows), 3)
             next_row = reader.read_row()
             self.assertIsNone(next_row)
 
     def test_multiple_readers(self):
-        layout = pybcsv.Layout()
-        layout.add_column("value", pybcsv.ColumnType.INT32)
-        with pybcsv.Writer(layout) as writer:
-            writer.open(self.test_file, compression_level=0)
-            for i in range(5):
-                writer.write_row([i])
+        path = self._fixture("int32_5rows", lambda p: _write_int_rows(p, 5))
 
         with pybcsv.Reader() as reader1, pybcsv.Reader() as reader2:
-            reader1.open(self.test_file)
-            reader2.open(self.test_file)
+            reader1.open(path)
+            reader2.open(path)
             data1 = reader1.read_all()
             data2 = reader2.read_all()
             self.assertEqual(data1, data2)
             self.assertEqual(len(data1), 5)
 
 
-class TestErrorHandlingEdgeCases(unittest.TestCase):
+class TestErrorHandlingEdgeCases(_ErrorTestCase):
     """Extended error handling and validation tests."""
 
-    def setUp(self):
-        self.temp_files = []
-
-    def tearDown(self):
-        for fp in self.temp_files:
-            if os.path.exists(fp):
-                os.unlink(fp)
-
-    def _tmp(self, suffix='.bcsv'):
-        fd, fp = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
-        os.unlink(fp)
-        self.temp_files.append(fp)
-        return fp
-
-    def _create_valid_file(self):
-        filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("id", pybcsv.INT32)
-        layout.add_column("name", pybcsv.STRING)
+    @classmethod
+    def _write_valid_file(cls, filepath):
+        layout = cls.LAYOUTS["id_name"]
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
         writer.write_row([1, "test"])
         writer.close()
-        return filepath
+
+    def _create_valid_file(self):
+        return self._fixture("valid", self._write_valid_file)
 
     def test_file_not_found_reader(self):
         reader = pybcsv.Reader()
@@ -196,8 +225,7 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
         self.assertFalse(reader.is_open())
 
     def test_file_not_found_writer(self):
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.INT32)
+        layout = self.LAYOUTS["int32"]
         writer = pybcsv.Writer(layout)
         # On Windows, Writer::open creates directories, so Unix-style paths
         # that resolve to C:\ may succeed. Use a non-existent drive instead.
@@ -209,11 +237,9 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
             writer.open(bad_path)
         self.assertFalse(writer.is_open())
 
+    @unittest.skipUnless(_IS_POSIX, "Permission test only on POSIX")
     def test_permission_denied(self):
-        if os.name != 'posix':
-            self.skipTest("Permission test only on POSIX")
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.INT32)
+        layout = self.LAYOUTS["int32"]
         writer = pybcsv.Writer(layout)
         with self.assertRaises(RuntimeError):
             writer.open("/root/test.bcsv")
@@ -227,12 +253,11 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
             reader.open(filepath)
 
     def test_truncated_file(self):
-        valid_fp = self._create_valid_file()
-        with open(valid_fp, 'rb') as f:
-            valid_content = f.read()
+        # Copy the shared valid file (copy_file_range/sendfile on Linux)
+        # and cut it in half in place; no file content passes through Python
         truncated_fp = self._tmp()
-        with open(truncated_fp, 'wb') as f:
-            f.write(valid_content[:len(valid_content) // 2])
+        shutil.copyfile(self._create_valid_file(), truncated_fp)
+        os.truncate(truncated_fp, os.path.getsize(truncated_fp) // 2)
         reader = pybcsv.Reader()
         try:
             opened = reader.open(truncated_fp)
@@ -249,10 +274,7 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
 
     def test_row_length_mismatch_extended(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("col1", pybcsv.INT32)
-        layout.add_column("col2", pybcsv.STRING)
-        layout.add_column("col3", pybcsv.DOUBLE)
+        layout = self.LAYOUTS["int_str_double"]
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
         writer.write_row([1, "test", 3.14])
@@ -260,11 +282,7 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
 
     def test_wrong_data_types_extended(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("int_col", pybcsv.INT32)
-        layout.add_column("string_col", pybcsv.STRING)
-        layout.add_column("double_col", pybcsv.DOUBLE)
-        layout.add_column("bool_col", pybcsv.BOOL)
+        layout = self.LAYOUTS["mixed4"]
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
         writer.write_row([42, "valid_string", 3.14, True])
@@ -272,15 +290,21 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
 
     def test_numeric_overflow(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("int8_col", pybcsv.INT8)
-        layout.add_column("uint8_col", pybcsv.UINT8)
-        layout.add_column("int32_col", pybcsv.INT32)
-        writer = pybcsv.Writer(layout)
-        writer.open(filepath)
-        writer.write_row([127, 255, 2147483647])
-        writer.write_row([-128, 0, -2147483648])
-        writer.close()
+        layout = self.LAYOUTS["narrow_ints"]
+        boundary_rows = [
+            [127, 255, 2147483647],
+            [-128, 0, -2147483648],
+        ]
+        # One writer for all cases: a failing row must not disturb the rest
+        with pybcsv.Writer(layout) as writer:
+            writer.open(filepath)
+            for row in boundary_rows:
+                with self.subTest(row=row):
+                    writer.write_row(row)
+
+        with pybcsv.Reader() as reader:
+            reader.open(filepath)
+            self.assertEqual(reader.read_all(), boundary_rows)
 
     def test_invalid_layout(self):
         empty_layout = pybcsv.Layout()
@@ -292,18 +316,14 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
 
     def test_batch_operation_errors(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("id", pybcsv.INT32)
-        layout.add_column("name", pybcsv.STRING)
+        layout = self.LAYOUTS["id_name"]
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
         writer.write_rows([[1, "valid1"], [2, "valid2"], [3, "valid3"]])
         writer.close()
 
     def test_file_operations_when_closed(self):
-        filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.INT32)
+        layout = self.LAYOUTS["int32"]
 
         writer = pybcsv.Writer(layout)
         try:
@@ -323,8 +343,7 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
 
     def test_double_close(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.INT32)
+        layout = self.LAYOUTS["int32"]
 
         writer = pybcsv.Writer(layout)
         writer.open(filepath)
@@ -335,7 +354,7 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
         self.assertFalse(writer.is_open())
 
         reader = pybcsv.Reader()
-        reader.open(filepath)
+        reader.open(self._fixture("int32_1row", lambda p: _write_int_rows(p, 1)))
         reader.read_all()
         reader.close()
         self.assertFalse(reader.is_open())
@@ -343,14 +362,7 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
         self.assertFalse(reader.is_open())
 
     def test_concurrent_file_access(self):
-        filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.INT32)
-
-        writer = pybcsv.Writer(layout)
-        writer.open(filepath)
-        writer.write_row([1])
-        writer.close()
+        filepath = self._fixture("int32_1row", lambda p: _write_int_rows(p, 1))
 
         reader1 = pybcsv.Reader()
         reader2 = pybcsv.Reader()
@@ -364,29 +376,24 @@ class TestErrorHandlingEdgeCases(unittest.TestCase):
 
     def test_large_string_errors(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("large_string", pybcsv.STRING)
-        writer = pybcsv.Writer(layout)
-        writer.open(filepath)
-        try:
-            huge_string = "x" * (100 * 1024 * 1024)
-            writer.write_row([huge_string])
-            writer.close()
-            reader = pybcsv.Reader()
+        layout = self.LAYOUTS["large_string"]
+        with pybcsv.Writer(layout) as writer:
+            writer.open(filepath)
+            # Cells over MAX_STRING_LENGTH (65535 bytes) are rejected from
+            # their size alone; a zero-filled bytes object is one calloc.
+            with self.assertRaises(pybcsv.ValidationError) as context:
+                writer.write_row([bytes(1024 * 1024)])
+            self.assertIn("exceeds maximum length", str(context.exception))
+            # The writer stays usable after the rejected row
+            writer.write_row(["ok"])
+
+        with pybcsv.Reader() as reader:
             reader.open(filepath)
-            data = reader.read_all()
-            reader.close()
-            self.assertEqual(len(data[0][0]), 100 * 1024 * 1024)
-        except (MemoryError, OverflowError, RuntimeError):
-            pass
-        finally:
-            if writer.is_open():
-                writer.close()
+            self.assertEqual(reader.read_all(), [["ok"]])
 
     def test_invalid_compression_level(self):
         filepath = self._tmp()
-        layout = pybcsv.Layout()
-        layout.add_column("test", pybcsv.INT32)
+        layout = self.LAYOUTS["int32"]
         writer = pybcsv.Writer(layout)
         try:
             writer.open(filepath, True, 100)
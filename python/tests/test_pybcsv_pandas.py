@@ -18,6 +18,7 @@ import tempfile
 import time
 import unittest
 import warnings
+from unittest import mock
 
 import numpy as np
 
@@ -30,27 +31,14 @@ except ImportError:
     HAS_PANDAS = False
 
 import pybcsv
+from pybcsv import pandas_utils
+from _sandbox import SandboxTestCase
 
 
 @unittest.skipUnless(HAS_PANDAS, "pandas not installed")
-class TestPandasIntegration(unittest.TestCase):
+class TestPandasIntegration(SandboxTestCase):
     """Test pandas DataFrame integration with PyBCSV."""
 
-    def setUp(self):
-        self.temp_files = []
-
-    def tearDown(self):
-        for fp in self.temp_files:
-            if os.path.exists(fp):
-                os.unlink(fp)
-
-    def _tmp(self, suffix=".bcsv"):
-        fd, fp = tempfile.mkstemp(suffix=suffix)
-        os.close(fd)
-        os.unlink(fp)
-        self.temp_files.append(fp)
-        return fp
-
     def test_basic_dataframe_roundtrip(self):
         filepath = self._tmp()
         df_original = pd.DataFrame(
@@ -99,6 +87,26 @@ class TestPandasIntegration(unittest.TestCase):
                     df_read[col].values, df_original[col].values
                 )
 
+    def test_read_dataframe_columnar_path(self):
+        # Without pyarrow, read_dataframe builds the frame from read_columns
+        filepath = self._tmp()
+        df_original = pd.DataFrame(
+            {
+                "id": np.arange(5, dtype=np.int32),
+                "name": ["a", "b", "c", "d", "e"],
+                "value": np.linspace(0.0, 1.0, 5, dtype=np.float32),
+                "flag": np.array([True, False, True, False, True]),
+            }
+        )
+        pybcsv.write_dataframe(df_original, filepath)
+        with mock.patch.object(pandas_utils, "_ARROW_AVAILABLE", False):
+            df_read = pybcsv.read_dataframe(filepath)
+            df_subset = pybcsv.read_dataframe(filepath, columns=["value", "id"])
+
+        pd.testing.assert_frame_equal(df_read, df_original)
+        # File order is kept, not the order of the requested columns
+        pd.testing.assert_frame_equal(df_subset, df_original[["id", "value"]])
+
     def test_empty_dataframe(self):
         filepath = self._tmp()
         df_empty = pd.DataFrame(columns=["id", "name", "value"])
@@ -107,16 +115,40 @@ class TestPandasIntegration(unittest.TestCase):
         self.assertEqual(len(df_read), 0)
         self.assertEqual(list(df_read.columns), ["id", "name", "value"])
 
+    def test_read_empty_dataframe_columnar_dtypes(self):
+        # A zero-row file read via read_columns keeps the layout dtypes
+        filepath = self._tmp()
+        df_original = pd.DataFrame(
+            {
+                "id": np.arange(3, dtype=np.int32),
+                "name": ["a", "b", "c"],
+                "value": np.zeros(3, dtype=np.float32),
+            }
+        )
+        pybcsv.write_dataframe(df_original.iloc[:0], filepath)
+        with mock.patch.object(pandas_utils, "_ARROW_AVAILABLE", False):
+            df_read = pybcsv.read_dataframe(filepath)
+            with mock.patch.object(pandas_utils, "_COLUMNAR_AVAILABLE", False):
+                df_legacy = pybcsv.read_dataframe(filepath)
+
+        self.assertEqual(len(df_read), 0)
+        self.assertEqual(df_read["id"].dtype, np.int32)
+        self.assertEqual(df_read["value"].dtype, np.float32)
+        self.assertFalse(pd.api.types.is_float_dtype(df_read["name"]))
+        pd.testing.assert_series_equal(df_read.dtypes, df_legacy.dtypes)
+
     def test_large_dataframe(self):
         filepath = self._tmp()
         n_rows = 10000
+        ids = np.arange(n_rows)
+        rng = np.random.default_rng(0)
         df_large = pd.DataFrame(
             {
-                "id": range(n_rows),
-                "category": [f"cat_{i % 100}" for i in range(n_rows)],
-                "value1": np.random.random(n_rows),
-                "value2": np.random.random(n_rows),
-                "active": [i % 2 == 0 for i in range(n_rows)],
+                "id": ids,
+                "category": np.char.add("cat_", (ids % 100).astype(str)),
+                "value1": rng.random(n_rows),
+                "value2": rng.random(n_rows),
+                "active": ids % 2 == 0,
             }
         )
         pybcsv.write_dataframe(df_large, filepath)
@@ -322,21 +354,24 @@ class TestPandasIntegration(unittest.TestCase):
         layout.add_column("id", pybcsv.INT32)
         layout.add_column("value", pybcsv.DOUBLE)
         layout.add_column("category", pybcsv.STRING)
-        manual_data = [
-            [row["id"], row["value"], row["category"]] for _, row in df.iterrows()
-        ]
+        # Row lists straight from the column arrays (no per-row Series)
+        manual_data = list(
+            map(list, zip(*(df[c].tolist() for c in ("id", "value", "category"))))
+        )
 
         writer = pybcsv.Writer(layout)
         writer.open(filepath_manual)
         writer.write_rows(manual_data)
         writer.close()
 
+        # read_all_arrays sizes its column arrays from the row count up front,
+        # so the frame is built from columns, not a list of row lists
         reader = pybcsv.Reader()
         reader.open(filepath_manual)
-        manual_read_data = reader.read_all()
+        manual_read_data = reader.read_all_arrays()
         reader.close()
 
-        manual_df = pd.DataFrame(manual_read_data, columns=["id", "value", "category"])
+        manual_df = pd.DataFrame(manual_read_data)
         pd.testing.assert_frame_equal(df_read, manual_df, check_dtype=False)
 
     def test_dataframe_compression_levels(self):
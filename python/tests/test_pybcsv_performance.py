@@ -12,8 +12,6 @@ and memory efficiency with larger datasets.
 # Licensed under the MIT License. See LICENSE file in the project root
 # for full license information.
 
-import os
-import tempfile
 import time
 
 import numpy as np
@@ -27,24 +25,12 @@ except ImportError:
 import pybcsv
 
 
-# ---------------------------------------------------------------------------
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _tmp(suffix=".bcsv"):
-    fd, path = tempfile.mkstemp(suffix=suffix, prefix="pybcsv_perf_")
-    os.close(fd)
-    os.unlink(path)
-    return path
-
-
 # ---------------------------------------------------------------------------
 # pytest-style tests (originally from test_optimizations.py)
 # ---------------------------------------------------------------------------
 
 
-def test_optimized_operations():
+def test_optimized_operations(tmp_path):
     """Test optimized read/write operations."""
     test_data = {
         "bool_col": [True, False, True] * 1000,
@@ -53,7 +39,7 @@ def test_optimized_operations():
         "string_col": ["test", "data", "row"] * 1000,
     }
     df = pd.DataFrame(test_data)
-    test_file = _tmp()
+    test_file = str(tmp_path / "frame.bcsv")
 
     pybcsv.write_dataframe(df, test_file, compression_level=1)
     df_read = pybcsv.read_dataframe(test_file)
@@ -66,7 +52,7 @@ def test_optimized_operations():
     layout.add_column("value", pybcsv.ColumnType.DOUBLE)
     layout.add_column("name", pybcsv.ColumnType.STRING)
 
-    batch_file = _tmp()
+    batch_file = str(tmp_path / "batch.bcsv")
     writer = pybcsv.Writer(layout)
     try:
         writer.open(batch_file)
@@ -87,72 +73,59 @@ def test_optimized_operations():
     finally:
         reader.close()
 
-    if os.path.exists(test_file):
-        os.unlink(test_file)
-    if os.path.exists(batch_file):
-        os.unlink(batch_file)
-
 
 # ---------------------------------------------------------------------------
 # unittest-style tests (originally from test_all_optimizations.py)
 # ---------------------------------------------------------------------------
 
 
-def test_individual_operations():
+def test_individual_operations(tmp_path):
     """Test basic optimized individual write/read operations."""
     layout = pybcsv.Layout()
     layout.add_column("id", pybcsv.INT32)
     layout.add_column("name", pybcsv.STRING)
     layout.add_column("value", pybcsv.DOUBLE)
 
-    filename = _tmp()
-    try:
-        writer = pybcsv.Writer(layout)
-        writer.open(filename)
-        writer.write_row([1, "Alice", 123.45])
-        writer.write_row([2, "Bob", 678.90])
-        writer.write_row([3, "Charlie", 111.22])
-        writer.close()
+    filename = str(tmp_path / "out.bcsv")
+    writer = pybcsv.Writer(layout)
+    writer.open(filename)
+    writer.write_row([1, "Alice", 123.45])
+    writer.write_row([2, "Bob", 678.90])
+    writer.write_row([3, "Charlie", 111.22])
+    writer.close()
 
-        reader = pybcsv.Reader()
-        reader.open(filename)
-        rows = reader.read_all()
-        reader.close()
+    reader = pybcsv.Reader()
+    reader.open(filename)
+    rows = reader.read_all()
+    reader.close()
 
-        assert len(rows) == 3
-        assert rows[0] == [1, "Alice", 123.45]
-    finally:
-        if os.path.exists(filename):
-            os.unlink(filename)
+    assert len(rows) == 3
+    assert rows[0] == [1, "Alice", 123.45]
 
 
-def test_batch_operations():
+def test_batch_operations(tmp_path):
     """Test optimized batch write operations."""
     layout = pybcsv.Layout()
     layout.add_column("id", pybcsv.INT32)
     layout.add_column("value", pybcsv.DOUBLE)
 
-    filename = _tmp()
-    try:
-        writer = pybcsv.Writer(layout)
-        writer.open(filename)
-        batch_data = [[i, float(i * 100)] for i in range(1, 6)]
-        writer.write_rows(batch_data)
-        writer.close()
+    filename = str(tmp_path / "out.bcsv")
+    writer = pybcsv.Writer(layout)
+    writer.open(filename)
+    batch_data = [[i, float(i * 100)] for i in range(1, 6)]
+    writer.write_rows(batch_data)
+    writer.close()
 
-        reader = pybcsv.Reader()
-        reader.open(filename)
-        rows = reader.read_all()
-        reader.close()
+    reader = pybcsv.Reader()
+    reader.open(filename)
+    rows = reader.read_all()
+    reader.close()
 
-        assert len(rows) == 5
-        assert rows[2] == [3, 300.0]
-    finally:
-        if os.path.exists(filename):
-            os.unlink(filename)
+    assert len(rows) == 5
+    assert rows[2] == [3, 300.0]
 
 
-def test_dataframe_integration():
+def test_dataframe_integration(tmp_path):
     """Test optimized pandas DataFrame integration."""
     df = pd.DataFrame(
         {
@@ -163,58 +136,56 @@ def test_dataframe_integration():
         }
     )
 
-    filename = _tmp()
-    try:
-        pybcsv.write_dataframe(df, filename)
-        df_read = pybcsv.read_dataframe(filename)
+    filename = str(tmp_path / "out.bcsv")
+    pybcsv.write_dataframe(df, filename)
+    df_read = pybcsv.read_dataframe(filename)
 
-        assert len(df_read) == len(df)
-        assert list(df_read.columns) == ["id", "name", "value", "active"]
-        assert df_read["id"].tolist() == [1, 2, 3, 4, 5]
-        assert df_read["name"].tolist() == ["Alice", "Bob", "Charlie", "David", "Eve"]
-    finally:
-        if os.path.exists(filename):
-            os.unlink(filename)
+    assert len(df_read) == len(df)
+    assert list(df_read.columns) == ["id", "name", "value", "active"]
+    assert df_read["id"].tolist() == [1, 2, 3, 4, 5]
+    assert df_read["name"].tolist() == ["Alice", "Bob", "Charlie", "David", "Eve"]
 
 
-def test_performance_comparison():
+def test_performance_comparison(tmp_path):
     """Test performance of batch vs individual operations."""
     n_rows = 1000
     layout = pybcsv.Layout()
     layout.add_column("id", pybcsv.INT32)
     layout.add_column("value", pybcsv.DOUBLE)
 
-    data = [[i, float(i * 10.5)] for i in range(n_rows)]
-    filename = _tmp()
-    try:
-        writer = pybcsv.Writer(layout)
-        writer.open(filename)
-        start = time.time()
-        writer.write_rows(data)
-        batch_time = time.time() - start
-        writer.close()
+    ids = np.arange(n_rows, dtype=np.int32)
+    vals = ids.astype(np.float64) * 10.5
+    # tolist() unboxes to native ints/floats in one C loop.
+    data = list(map(list, zip(ids.tolist(), vals.tolist())))
+    batch_file = str(tmp_path / "out1.bcsv")
+    individual_file = str(tmp_path / "out2.bcsv")
 
-        os.unlink(filename)
-        writer = pybcsv.Writer(layout)
-        writer.open(filename)
-        start = time.time()
-        for row in data:
-            writer.write_row(row)
-        individual_time = time.time() - start
-        writer.close()
+    writer = pybcsv.Writer(layout)
+    writer.open(batch_file)
+    start = time.perf_counter_ns()
+    writer.write_rows(data)
+    batch_ns = time.perf_counter_ns() - start
+    writer.close()
 
-        # Just verify both paths produce correct output
+    writer = pybcsv.Writer(layout)
+    writer.open(individual_file)
+    start = time.perf_counter_ns()
+    for i, v in zip(ids.tolist(), vals.tolist()):
+        writer.write_row([i, v])
+    individual_ns = time.perf_counter_ns() - start
+    writer.close()
+
+    # Just verify both paths produce correct output
+    for filename in (batch_file, individual_file):
         reader = pybcsv.Reader()
         reader.open(filename)
         rows = reader.read_all()
         reader.close()
         assert len(rows) == n_rows
-    finally:
-        if os.path.exists(filename):
-            os.unlink(filename)
+    assert batch_ns > 0 and individual_ns > 0
 
 
-def test_memory_optimization():
+def test_memory_optimization(tmp_path):
     """Test that optimizations work with larger datasets."""
     n_rows = 5000
     df = pd.DataFrame(
@@ -226,16 +197,12 @@ def test_memory_optimization():
         }
     )
 
-    filename = _tmp()
-    try:
-        pybcsv.write_dataframe(df, filename)
-        df_read = pybcsv.read_dataframe(filename)
+    filename = str(tmp_path / "out.bcsv")
+    pybcsv.write_dataframe(df, filename)
+    df_read = pybcsv.read_dataframe(filename)
 
-        assert len(df_read) == n_rows
-        assert np.array_equal(df_read["id"].values, df["id"].values)
-    finally:
-        if os.path.exists(filename):
-            os.unlink(filename)
+    assert len(df_read) == n_rows
+    assert np.array_equal(df_read["id"].values, df["id"].values)
 
 
 if __name__ == "__main__":